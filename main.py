@@ -26,12 +26,12 @@ import argparse
 import logging
 import subprocess
 import sys
-import time
-
-from src.config import LOG_LEVEL
 
 
 def _setup_logging() -> None:
+    # Imported here so `.env` is only parsed once a command actually runs
+    from src.config import LOG_LEVEL
+
     logging.basicConfig(
         level=getattr(logging, LOG_LEVEL, logging.INFO),
         format="%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
@@ -77,19 +77,22 @@ def cmd_run_once(_args: argparse.Namespace) -> None:
 
 def cmd_scheduler(_args: argparse.Namespace) -> None:
     """Start the background scheduler that polls continuously."""
-    from src.scheduler import job_pull_odds, job_scan_ev, start_scheduler, stop_scheduler
+    from src.scheduler import (
+        job_cycle,
+        start_scheduler,
+        stop_scheduler,
+        wait_until_interrupted,
+    )
 
     sched = start_scheduler()
 
-    # Immediate pull on startup
-    job_pull_odds()
-    job_scan_ev()
+    # Immediate pull + scan on startup
+    job_cycle()
 
     print("Scheduler running. Press Ctrl+C to stop.")
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        wait_until_interrupted()
+    finally:
         stop_scheduler()
         print("Stopped.")
 
@@ -105,20 +108,17 @@ def cmd_dashboard(_args: argparse.Namespace) -> None:
 
 def cmd_place_bet(args: argparse.Namespace) -> None:
     """Record a user bet from the CLI."""
-    from src.database import insert_user_bet
+    from src.database import get_latest_pinnacle_line, insert_user_bet
     from src.ev_calculation import calculate_edge, calculate_ev, implied_probability
-    from src.database import get_latest_pinnacle_odds
 
-    # Try to look up Pinnacle odds for EV/edge
+    # Try to look up the matching Pinnacle line for EV/edge
     ev = None
     edge = None
-    pin_lines = get_latest_pinnacle_odds(args.game, market_type=args.market)
-    for pl in pin_lines:
-        if pl["selection"] == args.selection and pl.get("point") == args.point:
-            fair_p = implied_probability(pl["odds_decimal"])
-            ev = round(calculate_ev(args.odds, fair_p), 2)
-            edge = round(calculate_edge(args.odds, pl["odds_decimal"]), 2)
-            break
+    pl = get_latest_pinnacle_line(args.game, args.market, args.selection, args.point)
+    if pl:
+        fair_p = implied_probability(pl["odds_decimal"])
+        ev = round(calculate_ev(args.odds, fair_p), 2)
+        edge = round(calculate_edge(args.odds, pl["odds_decimal"]), 2)
 
     bet_id = insert_user_bet(
         game_id=args.game,
@@ -142,8 +142,6 @@ def cmd_place_bet(args: argparse.Namespace) -> None:
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    _setup_logging()
-
     parser = argparse.ArgumentParser(
         description="NBA EV Tracker — betting EV analysis tool"
     )
@@ -180,6 +178,7 @@ def main() -> None:
 
     handler = commands.get(args.command)
     if handler:
+        _setup_logging()
         handler(args)
     else:
         parser.print_help()
@@ -0,0 +1,26 @@
+-- Migration: backfill the latest-line tables from existing odds history.
+-- Run after init_schema() has created latest_odds_snapshots /
+-- latest_pinnacle_odds and their triggers; new inserts keep them current.
+INSERT INTO latest_odds_snapshots
+    (id, game_id, sportsbook, region, market_type, selection, point,
+     player_name, odds_decimal, implied_prob, snapshot_time)
+SELECT DISTINCT ON (game_id, sportsbook, market_type, selection,
+                    COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+    id, game_id, sportsbook, region, market_type, selection, point,
+    player_name, odds_decimal, implied_prob, snapshot_time
+FROM odds_snapshots
+ORDER BY game_id, sportsbook, market_type, selection,
+         COALESCE(player_name, ''), COALESCE(point, 'NaN'), snapshot_time DESC, id DESC
+ON CONFLICT DO NOTHING;
+
+INSERT INTO latest_pinnacle_odds
+    (id, game_id, region, market_type, selection, point, player_name,
+     odds_decimal, implied_prob, snapshot_time, is_closing)
+SELECT DISTINCT ON (game_id, market_type, selection,
+                    COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+    id, game_id, region, market_type, selection, point, player_name,
+    odds_decimal, implied_prob, snapshot_time, is_closing
+FROM pinnacle_odds
+ORDER BY game_id, market_type, selection,
+         COALESCE(player_name, ''), COALESCE(point, 'NaN'), snapshot_time DESC, id DESC
+ON CONFLICT DO NOTHING;
@@ -31,7 +31,10 @@ CREATE TABLE IF NOT EXISTS odds_snapshots (
     snapshot_time   TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
-CREATE INDEX IF NOT EXISTS idx_odds_game ON odds_snapshots(game_id);
+-- (game_id, snapshot_time) serves the per-game history reads in order and
+-- supersedes the old single-column idx_odds_game
+DROP INDEX IF EXISTS idx_odds_game;
+CREATE INDEX IF NOT EXISTS idx_odds_game_time ON odds_snapshots(game_id, snapshot_time);
 CREATE INDEX IF NOT EXISTS idx_odds_book ON odds_snapshots(sportsbook);
 CREATE INDEX IF NOT EXISTS idx_odds_time ON odds_snapshots(snapshot_time);
 
@@ -52,6 +55,8 @@ CREATE TABLE IF NOT EXISTS pinnacle_odds (
 
 CREATE INDEX IF NOT EXISTS idx_pin_game ON pinnacle_odds(game_id);
 CREATE INDEX IF NOT EXISTS idx_pin_closing ON pinnacle_odds(is_closing);
+-- Closing-line lookups per game touch only the few flagged rows
+CREATE INDEX IF NOT EXISTS idx_pin_game_closing ON pinnacle_odds(game_id) WHERE is_closing;
 
 -- Positive-EV opportunities found by the scanner (full historical record)
 CREATE TABLE IF NOT EXISTS ev_opportunities (
@@ -129,3 +134,107 @@ CREATE TABLE IF NOT EXISTS bankroll_history (
     win_rate            REAL NOT NULL DEFAULT 0,
     total_bets          INTEGER NOT NULL DEFAULT 0
 );
+
+-- ------------------------------------------------------------
+-- Latest-line tables: one row per game / book / market / selection /
+-- player / point, kept current by statement-level triggers on the
+-- history tables so "latest odds" reads are an indexed lookup instead
+-- of a DISTINCT ON sort over the full history.
+-- ------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS latest_odds_snapshots (
+    id              BIGINT NOT NULL,            -- odds_snapshots.id of the latest row
+    game_id         TEXT NOT NULL REFERENCES games(game_id),
+    sportsbook      TEXT NOT NULL,
+    region          TEXT NOT NULL DEFAULT 'us',
+    market_type     TEXT NOT NULL,
+    selection       TEXT NOT NULL,
+    point           REAL,
+    player_name     TEXT,
+    odds_decimal    REAL NOT NULL,
+    implied_prob    REAL NOT NULL,
+    snapshot_time   TIMESTAMPTZ NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_latest_odds_key ON latest_odds_snapshots
+    (game_id, sportsbook, market_type, selection, COALESCE(player_name, ''), COALESCE(point, 'NaN'));
+
+CREATE TABLE IF NOT EXISTS latest_pinnacle_odds (
+    id              BIGINT NOT NULL,            -- pinnacle_odds.id of the latest row
+    game_id         TEXT NOT NULL REFERENCES games(game_id),
+    region          TEXT NOT NULL DEFAULT 'us',
+    market_type     TEXT NOT NULL,
+    selection       TEXT NOT NULL,
+    point           REAL,
+    player_name     TEXT,
+    odds_decimal    REAL NOT NULL,
+    implied_prob    REAL NOT NULL,
+    snapshot_time   TIMESTAMPTZ NOT NULL,
+    is_closing      BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_latest_pin_key ON latest_pinnacle_odds
+    (game_id, market_type, selection, COALESCE(player_name, ''), COALESCE(point, 'NaN'));
+
+CREATE OR REPLACE FUNCTION refresh_latest_odds() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO latest_odds_snapshots AS l
+        (id, game_id, sportsbook, region, market_type, selection, point,
+         player_name, odds_decimal, implied_prob, snapshot_time)
+    SELECT DISTINCT ON (game_id, sportsbook, market_type, selection,
+                        COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+        id, game_id, sportsbook, region, market_type, selection, point,
+        player_name, odds_decimal, implied_prob, snapshot_time
+    FROM new_rows
+    ORDER BY game_id, sportsbook, market_type, selection,
+             COALESCE(player_name, ''), COALESCE(point, 'NaN'), snapshot_time DESC, id DESC
+    ON CONFLICT (game_id, sportsbook, market_type, selection,
+                 COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+    DO UPDATE SET
+        id            = EXCLUDED.id,
+        region        = EXCLUDED.region,
+        odds_decimal  = EXCLUDED.odds_decimal,
+        implied_prob  = EXCLUDED.implied_prob,
+        snapshot_time = EXCLUDED.snapshot_time
+    WHERE EXCLUDED.snapshot_time >= l.snapshot_time;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_latest_odds ON odds_snapshots;
+CREATE TRIGGER trg_latest_odds
+    AFTER INSERT ON odds_snapshots
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_latest_odds();
+
+CREATE OR REPLACE FUNCTION refresh_latest_pinnacle_odds() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO latest_pinnacle_odds AS l
+        (id, game_id, region, market_type, selection, point, player_name,
+         odds_decimal, implied_prob, snapshot_time, is_closing)
+    SELECT DISTINCT ON (game_id, market_type, selection,
+                        COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+        id, game_id, region, market_type, selection, point, player_name,
+        odds_decimal, implied_prob, snapshot_time, is_closing
+    FROM new_rows
+    ORDER BY game_id, market_type, selection,
+             COALESCE(player_name, ''), COALESCE(point, 'NaN'), snapshot_time DESC, id DESC
+    ON CONFLICT (game_id, market_type, selection,
+                 COALESCE(player_name, ''), COALESCE(point, 'NaN'))
+    DO UPDATE SET
+        id            = EXCLUDED.id,
+        region        = EXCLUDED.region,
+        odds_decimal  = EXCLUDED.odds_decimal,
+        implied_prob  = EXCLUDED.implied_prob,
+        snapshot_time = EXCLUDED.snapshot_time,
+        is_closing    = EXCLUDED.is_closing
+    WHERE EXCLUDED.snapshot_time >= l.snapshot_time;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_latest_pinnacle_odds ON pinnacle_odds;
+CREATE TRIGGER trg_latest_pinnacle_odds
+    AFTER INSERT ON pinnacle_odds
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_latest_pinnacle_odds();
@@ -13,6 +13,7 @@ to be extended to email, Slack, or push-notification backends.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
@@ -24,21 +25,41 @@ logger = logging.getLogger(__name__)
 
 
 class AlertBackend(Protocol):
-    """Interface for pluggable alert destinations."""
+    """
+    Interface for pluggable alert destinations.
+
+    Backends may also implement ``send_batch(items)`` taking a list of
+    ``(title, body, level)`` tuples; batch alerts use it when present and
+    fall back to one ``send`` per item otherwise.
+    """
 
     def send(self, title: str, body: str, level: str) -> None: ...
 
 
+_LEVEL_PREFIX = {"INFO": "ℹ️ ", "WARNING": "⚠️ ", "SUCCESS": "✅ "}
+
+
 class ConsoleAlertBackend:
     """Default backend that prints to stdout and logs."""
 
+    @staticmethod
+    def _format(title: str, body: str, level: str) -> str:
+        return f"{_LEVEL_PREFIX.get(level, '')}[{title}] {body}"
+
     def send(self, title: str, body: str, level: str = "INFO") -> None:
         """Print and log the alert."""
-        prefix = {"INFO": "ℹ️ ", "WARNING": "⚠️ ", "SUCCESS": "✅ "}.get(level, "")
-        message = f"{prefix}[{title}] {body}"
+        message = self._format(title, body, level)
         print(message)
         logger.info(message)
 
+    def send_batch(self, items: list[tuple[str, str, str]]) -> None:
+        """Print and log many alerts with a single write and a single log record."""
+        if not items:
+            return
+        text = "\n".join(self._format(title, body, level) for title, body, level in items)
+        sys.stdout.write(text + "\n")
+        logger.info("%s", text)
+
 
 # Module-level default backend
 _backend: AlertBackend = ConsoleAlertBackend()
@@ -55,6 +76,46 @@ def set_alert_backend(backend: AlertBackend) -> None:
 # ---------------------------------------------------------------------------
 
 
+_EV_BODY_TEMPLATE = (
+    "{sportsbook} | {label}{selection} ({market_type}) @ {book_odds:.3f}  —  "
+    "EV {ev_percent:+.2f}%  Edge {edge_percent:+.2f}%"
+)
+
+
+def _format_ev_opportunity(opp: dict[str, Any]) -> tuple[str, str, str]:
+    """Build the (title, body, level) alert for a +EV opportunity."""
+    player = opp.get("player_name")
+    body = _EV_BODY_TEMPLATE.format_map({
+        **opp,
+        "sportsbook": opp["sportsbook"].upper(),
+        "label": f"{player} " if player else "",
+    })
+    return "New +EV Opportunity", body, "SUCCESS"
+
+
+def _format_bet_settled(result: dict[str, Any]) -> tuple[str, str, str]:
+    """Build the (title, body, level) alert for a settled bet."""
+    outcome = result["outcome"].upper()
+    pnl = result["profit_loss"]
+    sign = "+" if pnl >= 0 else ""
+    clv_str = f"  CLV {result['clv']:+.2f}%" if result.get("clv") is not None else ""
+    body = f"Bet #{result['bet_id']} → {outcome}  {sign}${pnl:.2f}{clv_str}"
+    level = "SUCCESS" if pnl >= 0 else "INFO"
+    return "Bet Settled", body, level
+
+
+def _send_batch(items: list[tuple[str, str, str]]) -> None:
+    """Deliver many alerts, using the backend's ``send_batch`` when it has one."""
+    if not items:
+        return
+    send_batch = getattr(_backend, "send_batch", None)
+    if send_batch is not None:
+        send_batch(items)
+    else:
+        for title, body, level in items:
+            _backend.send(title, body, level)
+
+
 def alert_new_ev_opportunity(opp: dict[str, Any]) -> None:
     """
     Fire an alert for a newly discovered positive-EV bet.
@@ -65,15 +126,7 @@ def alert_new_ev_opportunity(opp: dict[str, Any]) -> None:
         Opportunity dict with keys: sportsbook, selection, market_type,
         book_odds, ev_percent, edge_percent, game_id.
     """
-    title = "New +EV Opportunity"
-    player = opp.get("player_name")
-    label = f"{player} " if player else ""
-    body = (
-        f"{opp['sportsbook'].upper()} | {label}{opp['selection']} "
-        f"({opp['market_type']}) @ {opp['book_odds']:.3f}  —  "
-        f"EV {opp['ev_percent']:+.2f}%  Edge {opp['edge_percent']:+.2f}%"
-    )
-    _backend.send(title, body, "SUCCESS")
+    _backend.send(*_format_ev_opportunity(opp))
 
 
 def alert_line_movement(movement: dict[str, Any], game_label: str = "") -> None:
@@ -108,23 +161,14 @@ def alert_bet_settled(result: dict[str, Any]) -> None:
     result : dict
         Dict with keys: bet_id, outcome, profit_loss, clv.
     """
-    title = "Bet Settled"
-    outcome = result["outcome"].upper()
-    pnl = result["profit_loss"]
-    sign = "+" if pnl >= 0 else ""
-    clv_str = f"  CLV {result['clv']:+.2f}%" if result.get("clv") is not None else ""
-    body = f"Bet #{result['bet_id']} → {outcome}  {sign}${pnl:.2f}{clv_str}"
-    level = "SUCCESS" if pnl >= 0 else "INFO"
-    _backend.send(title, body, level)
+    _backend.send(*_format_bet_settled(result))
 
 
 def alert_batch_ev_opportunities(opportunities: list[dict[str, Any]]) -> None:
-    """Fire individual alerts for a list of new +EV opportunities."""
-    for opp in opportunities:
-        alert_new_ev_opportunity(opp)
+    """Fire alerts for a list of new +EV opportunities as one batch."""
+    _send_batch([_format_ev_opportunity(opp) for opp in opportunities])
 
 
 def alert_batch_settlements(settlements: list[dict[str, Any]]) -> None:
-    """Fire individual alerts for a list of settled bets."""
-    for result in settlements:
-        alert_bet_settled(result)
+    """Fire alerts for a list of settled bets as one batch."""
+    _send_batch([_format_bet_settled(result) for result in settlements])
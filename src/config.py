@@ -27,6 +27,11 @@ SPORT_KEY: str = "basketball_nba"
 # ca: Canada (Ontario), us/us2: USA, uk/eu/au: International (Pinnacle)
 ODDS_API_REGIONS: str = "ca,us,us2,uk,eu,au"
 
+# Per-event prop fetches: max requests in flight and max request starts per
+# second (The Odds API returns 429 when polled too aggressively)
+ODDS_API_MAX_CONCURRENCY: int = int(os.getenv("ODDS_API_MAX_CONCURRENCY", "4"))
+ODDS_API_REQUESTS_PER_SECOND: float = float(os.getenv("ODDS_API_REQUESTS_PER_SECOND", "2"))
+
 # Preferred region for display (user can override in .env)
 PREFERRED_REGION: str = os.getenv("PREFERRED_REGION", "ca")
 
@@ -48,13 +53,18 @@ SPORTSBOOKS: list[str] = [
     "bovada",
 ]
 
+SPORTSBOOK_KEYS: frozenset[str] = frozenset(SPORTSBOOKS)  # for O(1) per-row book checks
+
 PINNACLE_KEY: str = "pinnacle"
 
 # All bookmakers we request in a single API call
 ALL_BOOKMAKERS: list[str] = SPORTSBOOKS + [PINNACLE_KEY]
+ALL_BOOKMAKERS_CSV: str = ",".join(ALL_BOOKMAKERS)  # as sent in the `bookmakers` query param
+KNOWN_BOOKMAKERS: frozenset[str] = frozenset(ALL_BOOKMAKERS)  # for O(1) filtering of API book keys
 
 # Standard game markets
 GAME_MARKETS: list[str] = ["h2h", "spreads", "totals"]
+GAME_MARKETS_CSV: str = ",".join(GAME_MARKETS)  # as sent in the `markets` query param
 
 # Player prop markets
 PROP_MARKETS: list[str] = [
@@ -69,9 +79,11 @@ PROP_MARKETS: list[str] = [
     "player_points_assists",
     "player_rebounds_assists",
 ]
+PROP_MARKETS_CSV: str = ",".join(PROP_MARKETS)  # as sent in the `markets` query param
 
 # All markets to fetch
 MARKETS: list[str] = GAME_MARKETS + PROP_MARKETS
+KNOWN_MARKETS: frozenset[str] = frozenset(MARKETS)  # for O(1) validation of API market keys
 
 # ---------------------------------------------------------------------------
 # PostgreSQL
@@ -86,6 +98,10 @@ DATABASE_URL: str = (
     f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+DB_POOL_MIN_CONN: int = int(os.getenv("DB_POOL_MIN_CONN", "1"))
+# Defaults to 2 × CPUs + 4 so parallel bulk loads don't starve the pool
+DB_POOL_MAX_CONN: int = int(os.getenv("DB_POOL_MAX_CONN", str((os.cpu_count() or 1) * 2 + 4)))
+
 # ---------------------------------------------------------------------------
 # Scheduler / polling
 # ---------------------------------------------------------------------------
@@ -96,6 +112,8 @@ POLL_INTERVAL_MINUTES: int = int(os.getenv("POLL_INTERVAL_MINUTES", "5"))
 # ---------------------------------------------------------------------------
 MIN_EV_THRESHOLD: float = float(os.getenv("MIN_EV_THRESHOLD", "1.0"))
 LINE_MOVEMENT_THRESHOLD: float = float(os.getenv("LINE_MOVEMENT_THRESHOLD", "3.0"))
+# Per-game reads run concurrently (EV scan, line moves); each holds a pooled connection
+EV_SCAN_MAX_WORKERS: int = int(os.getenv("EV_SCAN_MAX_WORKERS", "8"))
 
 # ---------------------------------------------------------------------------
 # Bankroll
@@ -8,43 +8,149 @@ fetch completed-game scores to settle bets.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json is slower on large prop payloads
+    from json import loads as _json_loads
 
 from src.config import (
-    ALL_BOOKMAKERS,
-    GAME_MARKETS,
+    ALL_BOOKMAKERS_CSV,
+    GAME_MARKETS_CSV,
+    KNOWN_BOOKMAKERS,
+    KNOWN_MARKETS,
     ODDS_API_BASE_URL,
     ODDS_API_KEY,
+    ODDS_API_MAX_CONCURRENCY,
     ODDS_API_REGIONS,
+    ODDS_API_REQUESTS_PER_SECOND,
     PINNACLE_KEY,
     PROP_MARKETS,
+    PROP_MARKETS_CSV,
     SPORT_KEY,
     SPORTSBOOKS,
 )
 from src.database import (
     bulk_insert_odds,
     bulk_insert_pinnacle_odds,
-    mark_pinnacle_closing,
-    upsert_game,
+    bulk_mark_pinnacle_closing,
+    bulk_upsert_games,
+    transaction,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# HTTP session (module-level, keep-alive + retry)
+# ---------------------------------------------------------------------------
+
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
+
+def close_session() -> None:
+    """Close pooled HTTP connections held by the module-level session."""
+    _SESSION.close()
+
+
+def _decode_json(resp: requests.Response) -> Any:
+    """
+    Decode a response body straight from bytes with the fastest available parser.
+
+    A malformed body raises ``requests.exceptions.JSONDecodeError``, as
+    ``resp.json()`` would, so ``requests.RequestException`` handlers still
+    catch it.
+    """
+    try:
+        return _json_loads(resp.content)
+    except json.JSONDecodeError as exc:  # orjson's error subclasses the stdlib one
+        raise requests.exceptions.JSONDecodeError(
+            exc.msg, exc.doc, exc.pos, response=resp
+        ) from exc
+
+
+# Conditional-GET state per request: cache_key -> (ETag or None, body digest)
+_response_cache: dict[str, tuple[str | None, bytes]] = {}
+_response_cache_lock = threading.Lock()
+
+
+def _get_if_changed(url: str, params: dict[str, Any]) -> tuple[requests.Response, Any | None]:
+    """
+    GET ``url`` and decode its JSON, or signal that nothing changed since the last poll.
+
+    Sends ``If-None-Match`` when the previous response carried an ETag.  If
+    the API doesn't send ETags, falls back to comparing a digest of the body.
+
+    Returns ``(response, payload)`` where ``payload`` is None when the
+    response is a 304 or byte-identical to the previous one.
+    """
+    key = url + "?" + "&".join(
+        f"{k}={v}" for k, v in sorted(params.items()) if k != "apiKey"
+    )
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+    resp = _SESSION.get(url, params=params, headers=headers, timeout=30)
+    if resp.status_code == 304:
+        return resp, None
+    resp.raise_for_status()
+
+    digest = hashlib.blake2b(resp.content, digest_size=16).digest()
+    # Decode before recording the body, so a malformed one is re-fetched next poll
+    payload = None if cached and cached[1] == digest else _decode_json(resp)
+    with _response_cache_lock:
+        _response_cache[key] = (resp.headers.get("ETag"), digest)
+    return resp, payload
+
+
+def reset_response_cache() -> None:
+    """Forget conditional-GET state so the next poll re-fetches and re-stores everything."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
 # ---------------------------------------------------------------------------
 # Odds-format helpers
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1024)
 def american_to_decimal(american: int | float) -> float:
     """
     Convert American odds to decimal odds.
 
+    Memoised: quoted prices cluster on a small set of values (-110, -105,
+    +100, …).  ``-110`` and ``-110.0`` hash equal and share a cache entry,
+    which is safe because both produce the same result.
+
     >>> american_to_decimal(-110)
     1.909090909090909
     >>> american_to_decimal(150)
@@ -67,55 +173,78 @@ def decimal_to_implied_probability(decimal_odds: float) -> float:
     return 1 / decimal_odds
 
 
+def decimal_to_implied_probabilities(decimal_odds: np.ndarray) -> np.ndarray:
+    """
+    Vectorised :func:`decimal_to_implied_probability` over an array of odds.
+
+    Non-positive odds map to 0.0, matching the scalar version.
+    """
+    odds = np.asarray(decimal_odds, dtype=np.float64)
+    return np.divide(1.0, odds, out=np.zeros_like(odds), where=odds > 0)
+
+
 # ---------------------------------------------------------------------------
 # The Odds API — fetch odds
 # ---------------------------------------------------------------------------
 
+# Query params shared by every odds request; only `markets` varies per call
+_ODDS_PARAMS: dict[str, str] = {
+    "apiKey": ODDS_API_KEY,
+    "regions": ODDS_API_REGIONS,
+    "oddsFormat": "decimal",
+    "bookmakers": ALL_BOOKMAKERS_CSV,
+}
+
 
-def fetch_odds_for_market(market: str) -> list[dict[str, Any]]:
+def fetch_odds_for_market(markets: list[str] | str) -> list[dict[str, Any]]:
     """
-    Fetch odds for a single game-level market from The Odds API.
+    Fetch odds for one or more game-level markets from The Odds API.
 
     Parameters
     ----------
-    market : str
-        One of 'h2h', 'spreads', 'totals'.
+    markets : list[str] | str
+        Market keys from 'h2h', 'spreads', 'totals', or the same keys
+        already joined with commas (e.g. ``GAME_MARKETS_CSV``).  All of
+        them come back on each event in a single response.
 
     Returns
     -------
     list[dict]
-        Raw JSON response — list of event objects.
+        Raw JSON response — list of event objects.  Empty when the odds are
+        unchanged since the previous poll (nothing new to store).
     """
     url = f"{ODDS_API_BASE_URL}/sports/{SPORT_KEY}/odds"
-    params = {
-        "apiKey": ODDS_API_KEY,
-        "regions": ODDS_API_REGIONS,
-        "markets": market,
-        "oddsFormat": "decimal",
-        "bookmakers": ",".join(ALL_BOOKMAKERS),
-    }
-
-    resp = requests.get(url, params=params, timeout=30)
-    resp.raise_for_status()
+    markets_csv = markets if isinstance(markets, str) else ",".join(markets)
+    params = {**_ODDS_PARAMS, "markets": markets_csv}
 
+    resp, events = _get_if_changed(url, params)
     remaining = resp.headers.get("x-requests-remaining", "?")
+    if events is None:
+        logger.info(
+            "%s odds unchanged since last poll — API requests remaining: %s",
+            markets_csv, remaining,
+        )
+        return []
+
     logger.info(
         "Fetched %s odds — %s events — API requests remaining: %s",
-        market, len(resp.json()), remaining,
+        markets_csv, len(events), remaining,
     )
-    return resp.json()
+    return events
 
 
 def _fetch_event_ids() -> list[str]:
     """Fetch the list of upcoming event IDs for the sport."""
     url = f"{ODDS_API_BASE_URL}/sports/{SPORT_KEY}/events"
     params = {"apiKey": ODDS_API_KEY}
-    resp = requests.get(url, params=params, timeout=30)
+    resp = _SESSION.get(url, params=params, timeout=30)
     resp.raise_for_status()
-    return [e["id"] for e in resp.json()]
+    return [e["id"] for e in _decode_json(resp)]
 
 
-def fetch_props_for_event(event_id: str, markets: list[str]) -> dict[str, Any] | None:
+def fetch_props_for_event(
+    event_id: str, markets: list[str] | str
+) -> dict[str, Any] | None:
     """
     Fetch player prop odds for a single event using the per-event endpoint.
 
@@ -123,32 +252,82 @@ def fetch_props_for_event(event_id: str, markets: list[str]) -> dict[str, Any] |
     ----------
     event_id : str
         The Odds API event ID.
-    markets : list[str]
-        Prop market keys, e.g. ['player_points', 'player_rebounds', 'player_assists'].
+    markets : list[str] | str
+        Prop market keys, e.g. ['player_points', 'player_rebounds', 'player_assists'],
+        or the same keys already joined with commas (e.g. ``PROP_MARKETS_CSV``).
 
     Returns
     -------
     dict | None
-        Single event object with bookmaker/market data, or None on failure.
+        Single event object with bookmaker/market data, or None on failure
+        or when the props are unchanged since the previous poll.
     """
     url = f"{ODDS_API_BASE_URL}/sports/{SPORT_KEY}/events/{event_id}/odds"
-    params = {
-        "apiKey": ODDS_API_KEY,
-        "regions": ODDS_API_REGIONS,
-        "markets": ",".join(markets),
-        "oddsFormat": "decimal",
-        "bookmakers": ",".join(ALL_BOOKMAKERS),
-    }
-
-    resp = requests.get(url, params=params, timeout=30)
-    resp.raise_for_status()
+    markets_csv = markets if isinstance(markets, str) else ",".join(markets)
+    params = {**_ODDS_PARAMS, "markets": markets_csv}
 
+    resp, event = _get_if_changed(url, params)
     remaining = resp.headers.get("x-requests-remaining", "?")
     logger.info(
-        "Fetched props for event %s — API requests remaining: %s",
-        event_id, remaining,
+        "%s props for event %s — API requests remaining: %s",
+        "Fetched" if event is not None else "Unchanged", event_id, remaining,
     )
-    return resp.json()
+    return event
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces request start times ``1 / per_second`` apart."""
+
+    def __init__(self, per_second: float) -> None:
+        self._interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller is allowed to start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def fetch_all_props(
+    event_ids: list[str], markets: list[str] | str
+) -> list[dict[str, Any]]:
+    """
+    Fetch player props for many events concurrently.
+
+    Up to ``ODDS_API_MAX_CONCURRENCY`` requests are in flight at once and
+    request starts are capped at ``ODDS_API_REQUESTS_PER_SECOND``, so
+    network round-trips overlap instead of running back to back.  A failed
+    event is logged and skipped without aborting the rest of the batch.
+
+    Returns the event objects in the same order as ``event_ids``.
+    """
+    if not event_ids:
+        return []
+
+    limiter = _RateLimiter(ODDS_API_REQUESTS_PER_SECOND)
+    markets_csv = markets if isinstance(markets, str) else ",".join(markets)
+
+    def _fetch(eid: str) -> dict[str, Any] | None:
+        limiter.wait()
+        return fetch_props_for_event(eid, markets_csv)
+
+    events: list[dict[str, Any]] = []
+    workers = max(1, min(ODDS_API_MAX_CONCURRENCY, len(event_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(eid, pool.submit(_fetch, eid)) for eid in event_ids]
+        for eid, fut in futures:
+            try:
+                event = fut.result()
+                if event:
+                    events.append(event)
+            except requests.RequestException as exc:
+                logger.error("Failed to fetch props for event %s: %s", eid, exc)
+    return events
 
 
 def fetch_all_odds() -> list[dict[str, Any]]:
@@ -156,18 +335,17 @@ def fetch_all_odds() -> list[dict[str, Any]]:
     Fetch odds for every configured market and return the combined list
     of event objects.
 
-    Game markets (h2h, spreads, totals) use the bulk endpoint.
-    Player props use the per-event endpoint.
+    Game markets (h2h, spreads, totals) come from the bulk endpoint in a
+    single request.
+    Player props use the per-event endpoint, fetched concurrently.
     """
     all_events: list[dict[str, Any]] = []
 
-    # Game markets — bulk fetch
-    for market in GAME_MARKETS:
-        try:
-            events = fetch_odds_for_market(market)
-            all_events.extend(events)
-        except requests.RequestException as exc:
-            logger.error("Failed to fetch %s odds: %s", market, exc)
+    # Game markets — one bulk request carrying every game market per event
+    try:
+        all_events.extend(fetch_odds_for_market(GAME_MARKETS_CSV))
+    except requests.RequestException as exc:
+        logger.error("Failed to fetch game odds: %s", exc)
 
     # Player props — per-event fetch
     if PROP_MARKETS:
@@ -177,15 +355,7 @@ def fetch_all_odds() -> list[dict[str, Any]]:
             logger.error("Failed to fetch event list for props: %s", exc)
             event_ids = []
 
-        for i, eid in enumerate(event_ids):
-            if i > 0:
-                time.sleep(1)  # rate-limit: 1 second between per-event calls
-            try:
-                event = fetch_props_for_event(eid, PROP_MARKETS)
-                if event:
-                    all_events.append(event)
-            except requests.RequestException as exc:
-                logger.error("Failed to fetch props for event %s: %s", eid, exc)
+        all_events.extend(fetch_all_props(event_ids, PROP_MARKETS_CSV))
 
     return all_events
 
@@ -195,73 +365,140 @@ def fetch_all_odds() -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def _parse_market_type(market_key: str) -> str:
-    """Map The Odds API market key to our internal type (identity for all known keys)."""
-    return market_key
+# Last stored outcome digest per (game_id, sportsbook, market_type); a market
+# whose outcomes hash the same as last time is not re-stored.  In memory only,
+# so a restart (or a different database) stores every market once.
+_market_hashes: dict[tuple[str, str, str], str] = {}
+
+
+def _market_digest(outcomes: list[dict[str, Any]]) -> str:
+    """Stable digest of a market's (selection, point, player, price) outcomes."""
+    key = repr([
+        (o["name"], o.get("point"), o.get("description"), o["price"]) for o in outcomes
+    ])
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def reset_market_hashes() -> None:
+    """Forget stored market digests so the next poll stores every market again."""
+    _market_hashes.clear()
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp; cached since each game's string repeats across fetches."""
+    return datetime.fromisoformat(timestamp)
 
 
-def parse_and_store_odds(events: list[dict[str, Any]]) -> dict[str, list[dict]]:
+@dataclass
+class OddsColumns:
+    """
+    Structure-of-arrays buffer for parsed outcomes — one list per column.
+
+    Appending column-wise avoids allocating a row tuple per outcome; the
+    database layer zips the columns into rows only while streaming them out.
+    """
+
+    game_id: list[str] = field(default_factory=list)
+    sportsbook: list[str] = field(default_factory=list)
+    market_type: list[str] = field(default_factory=list)
+    selection: list[str] = field(default_factory=list)
+    point: list[float | None] = field(default_factory=list)
+    player_name: list[str | None] = field(default_factory=list)
+    odds_decimal: list[float] = field(default_factory=list)
+    implied_prob: list[float] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.game_id)
+
+
+def parse_and_store_odds(events: list[dict[str, Any]]) -> dict[str, OddsColumns]:
     """
     Parse raw API events, upsert games, and store odds in the database.
 
-    Returns a dict with keys ``"sportsbook_rows"`` and ``"pinnacle_rows"``
-    containing the structured data that was persisted.
+    Markets whose outcomes are identical to the last stored snapshot for
+    the same game and book are skipped; the latest-odds queries already
+    pick up the earlier row.
+
+    Returns a dict with keys ``"sportsbook_odds"`` and ``"pinnacle_odds"``
+    holding the :class:`OddsColumns` that were persisted.
     """
     now = datetime.now(timezone.utc)
-    sportsbook_rows: list[tuple] = []
-    pinnacle_rows: list[tuple] = []
+
+    # First pass: append every outcome column-wise into the sportsbook or
+    # Pinnacle buffer so implied probabilities can be computed vectorised.
+    book_cols = OddsColumns()
+    pin_cols = OddsColumns()
+    # The same game appears once per market fetch — upsert each only once
+    games_to_upsert: dict[str, tuple] = {}
+    new_hashes: dict[tuple[str, str, str], str] = {}
 
     for event in events:
         game_id = event["id"]
         home = event["home_team"]
         away = event["away_team"]
-        commence = datetime.fromisoformat(event["commence_time"])
+        commence = _parse_iso(event["commence_time"])
 
-        # Upsert the game record
-        upsert_game(game_id, home, away, commence)
+        games_to_upsert[game_id] = (game_id, home, away, commence, None, None, "upcoming")
 
         for bookmaker in event.get("bookmakers", []):
             book_key = bookmaker["key"]
+            # The API can return books outside our whitelist (e.g. when regions widen)
+            if book_key not in KNOWN_BOOKMAKERS:
+                continue
+            cols = pin_cols if book_key == PINNACLE_KEY else book_cols
 
             for market in bookmaker.get("markets", []):
-                market_type = _parse_market_type(market["key"])
-
-                for outcome in market.get("outcomes", []):
-                    selection = outcome["name"]
-                    odds_dec = float(outcome["price"])
-                    point = outcome.get("point")
-                    player_name = outcome.get("description")  # player name for props, None for game markets
-                    impl_prob = decimal_to_implied_probability(odds_dec)
-
-                    # Sportsbook row: (game_id, book_key, market_type, selection,
-                    #   point, player_name, odds_dec, impl_prob, snapshot_time)
-                    row = (
-                        game_id, book_key, market_type, selection,
-                        point, player_name, odds_dec, impl_prob, now,
-                    )
-
-                    if book_key == PINNACLE_KEY:
-                        # Pinnacle row: (game_id, market_type, selection, point,
-                        #   player_name, odds_dec, impl_prob, snapshot_time, is_closing)
-                        pin_row = (
-                            game_id, market_type, selection, point,
-                            player_name, odds_dec, impl_prob, now, False,
-                        )
-                        pinnacle_rows.append(pin_row)
-                    else:
-                        sportsbook_rows.append(row)
-
-    # Bulk persist
-    bulk_insert_odds(sportsbook_rows)
-    bulk_insert_pinnacle_odds(pinnacle_rows)
+                # API market keys are used as-is; skip anything we don't track
+                market_type = market["key"]
+                if market_type not in KNOWN_MARKETS:
+                    continue
+
+                outcomes = market.get("outcomes", [])
+                hash_key = (game_id, book_key, market_type)
+                digest = _market_digest(outcomes)
+                if _market_hashes.get(hash_key) == digest:
+                    continue  # nothing moved since the last stored snapshot
+                new_hashes[hash_key] = digest
+
+                for outcome in outcomes:
+                    cols.game_id.append(game_id)
+                    cols.sportsbook.append(book_key)
+                    cols.market_type.append(market_type)
+                    cols.selection.append(outcome["name"])
+                    cols.point.append(outcome.get("point"))
+                    # player name for props, None for game markets
+                    cols.player_name.append(outcome.get("description"))
+                    cols.odds_decimal.append(float(outcome["price"]))
+
+    for cols in (book_cols, pin_cols):
+        cols.implied_prob = decimal_to_implied_probabilities(cols.odds_decimal).tolist()
+
+    # Bulk persist in one transaction (games first — odds rows reference them).
+    # Snapshots can be re-pulled, so the commit needn't wait on the WAL flush.
+    with transaction(durable=False):
+        bulk_upsert_games(list(games_to_upsert.values()))
+        bulk_insert_odds((
+            book_cols.game_id, book_cols.sportsbook, book_cols.market_type,
+            book_cols.selection, book_cols.point, book_cols.player_name,
+            book_cols.odds_decimal, book_cols.implied_prob, [now] * len(book_cols),
+        ))
+        bulk_insert_pinnacle_odds((
+            pin_cols.game_id, pin_cols.market_type, pin_cols.selection,
+            pin_cols.point, pin_cols.player_name, pin_cols.odds_decimal,
+            pin_cols.implied_prob, [now] * len(pin_cols), [False] * len(pin_cols),
+        ))
+
+    # Only remember digests once their rows are safely stored
+    _market_hashes.update(new_hashes)
 
     logger.info(
         "Stored %d sportsbook odds + %d Pinnacle odds.",
-        len(sportsbook_rows), len(pinnacle_rows),
+        len(book_cols), len(pin_cols),
     )
     return {
-        "sportsbook_rows": sportsbook_rows,
-        "pinnacle_rows": pinnacle_rows,
+        "sportsbook_odds": book_cols,
+        "pinnacle_odds": pin_cols,
     }
 
 
@@ -289,9 +526,9 @@ def fetch_scores(days_from: int = 3) -> list[dict[str, Any]]:
         "apiKey": ODDS_API_KEY,
         "daysFrom": days_from,
     }
-    resp = requests.get(url, params=params, timeout=30)
+    resp = _SESSION.get(url, params=params, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    return _decode_json(resp)
 
 
 def update_game_results(scores: list[dict[str, Any]] | None = None) -> list[str]:
@@ -304,7 +541,7 @@ def update_game_results(scores: list[dict[str, Any]] | None = None) -> list[str]
     if scores is None:
         scores = fetch_scores()
 
-    newly_completed: list[str] = []
+    games_to_upsert: dict[str, tuple] = {}
 
     for event in scores:
         game_id = event["id"]
@@ -315,7 +552,7 @@ def update_game_results(scores: list[dict[str, Any]] | None = None) -> list[str]
 
         home_team = event["home_team"]
         away_team = event["away_team"]
-        commence = datetime.fromisoformat(event["commence_time"])
+        commence = _parse_iso(event["commence_time"])
 
         home_score = None
         away_score = None
@@ -325,17 +562,22 @@ def update_game_results(scores: list[dict[str, Any]] | None = None) -> list[str]
             elif score_entry["name"] == away_team:
                 away_score = int(score_entry["score"])
 
-        upsert_game(
+        games_to_upsert[game_id] = (
             game_id, home_team, away_team, commence,
-            home_score=home_score, away_score=away_score,
-            status="completed",
+            home_score, away_score, "completed",
         )
 
-        # Mark Pinnacle closing line
-        mark_pinnacle_closing(game_id)
-        newly_completed.append(game_id)
+    newly_completed = list(games_to_upsert)
+    with transaction():
+        bulk_upsert_games(list(games_to_upsert.values()))
+        # Mark Pinnacle closing lines
+        bulk_mark_pinnacle_closing(newly_completed)
 
+    # Finished games won't be polled again — drop their market digests
     if newly_completed:
+        done = set(newly_completed)
+        for key in [k for k in _market_hashes if k[0] in done]:
+            del _market_hashes[key]
         logger.info("Updated %d completed games.", len(newly_completed))
     return newly_completed
 
@@ -350,13 +592,22 @@ def pull_and_store_latest() -> dict[str, Any]:
     End-to-end: fetch all odds, store them, fetch scores, update results.
     Returns a summary dict.
     """
-    events = fetch_all_odds()
-    odds_summary = parse_and_store_odds(events)
-    completed_ids = update_game_results()
+    # Scores don't depend on the odds pull — fetch them in the background
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        scores_future = pool.submit(fetch_scores)
+        events = fetch_all_odds()
+        try:
+            odds_summary = parse_and_store_odds(events)
+        except Exception:
+            # These responses were never stored — don't skip them next poll
+            reset_response_cache()
+            raise
+        scores = scores_future.result()
+    completed_ids = update_game_results(scores)
     return {
         "events_fetched": len(events),
-        "sportsbook_odds_stored": len(odds_summary["sportsbook_rows"]),
-        "pinnacle_odds_stored": len(odds_summary["pinnacle_rows"]),
+        "sportsbook_odds_stored": len(odds_summary["sportsbook_odds"]),
+        "pinnacle_odds_stored": len(odds_summary["pinnacle_odds"]),
         "games_completed": completed_ids,
     }
 
@@ -8,17 +8,27 @@ user bets, and bankroll history.
 
 from __future__ import annotations
 
+import csv
+import functools
+import io
 import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import count, islice
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Iterable, Iterator, NamedTuple, Sequence
 
 import psycopg2
-import psycopg2.extras
+import psycopg2.extensions
 import psycopg2.pool
+from psycopg2.extras import RealDictCursor, execute_values as _execute_values
 
-from src.config import DATABASE_URL
+from src.config import DATABASE_URL, DB_POOL_MAX_CONN, DB_POOL_MIN_CONN, EV_SCAN_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -28,23 +38,76 @@ logger = logging.getLogger(__name__)
 _pool: psycopg2.pool.ThreadedConnectionPool | None = None
 
 
+class _SessionConnection(psycopg2.extensions.connection):
+    """Connection that tracks per-session state: tuning applied, statements PREPAREd."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.configured = False
+        self.prepared: set[str] = set()
+
+
+# Session settings applied once to every new pooled connection.  The app's
+# queries are short OLTP lookups, where JIT compilation costs more than it saves.
+_SESSION_SETTINGS = "SET jit = off;"
+
+
+def _configure(conn: _SessionConnection) -> None:
+    """Apply ``_SESSION_SETTINGS`` to a freshly opened connection."""
+    with conn.cursor() as cur:
+        cur.execute(_SESSION_SETTINGS)
+    # Commit so the settings outlive any rollback of the caller's transaction
+    conn.commit()
+    conn.configured = True
+
+
 def get_pool() -> psycopg2.pool.ThreadedConnectionPool:
     """Return (and lazily create) the module-level connection pool."""
     global _pool
     if _pool is None or _pool.closed:
         _pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=1, maxconn=10, dsn=DATABASE_URL
+            minconn=DB_POOL_MIN_CONN, maxconn=DB_POOL_MAX_CONN, dsn=DATABASE_URL,
+            connection_factory=_SessionConnection,
+        )
+        logger.info(
+            "Database connection pool created (%d–%d connections).",
+            DB_POOL_MIN_CONN, DB_POOL_MAX_CONN,
         )
-        logger.info("Database connection pool created.")
     return _pool
 
 
+def reader_workers(n_tasks: int) -> int:
+    """
+    Thread count for running ``n_tasks`` database reads concurrently.
+
+    Capped at ``EV_SCAN_MAX_WORKERS`` and one below the pool size, since
+    each worker holds a pooled connection while it reads.
+    """
+    return max(1, min(EV_SCAN_MAX_WORKERS, DB_POOL_MAX_CONN - 1, n_tasks))
+
+
+# Connection of the enclosing ``transaction()`` block, per thread
+_tx_local = threading.local()
+
+
 @contextmanager
 def get_connection() -> Generator:
-    """Context manager that checks out / returns a pooled connection."""
+    """
+    Context manager that checks out / returns a pooled connection.
+
+    Inside a :func:`transaction` block the thread's open connection is
+    reused and the commit is left to that block.
+    """
+    conn = getattr(_tx_local, "conn", None)
+    if conn is not None:
+        yield conn
+        return
+
     pool = get_pool()
     conn = pool.getconn()
     try:
+        if not conn.configured:
+            _configure(conn)
         yield conn
         conn.commit()
     except Exception:
@@ -54,6 +117,93 @@ def get_connection() -> Generator:
         pool.putconn(conn)
 
 
+@contextmanager
+def transaction(durable: bool = True) -> Generator:
+    """
+    Group several CRUD calls into a single transaction.
+
+    Every database function called in this thread inside the block shares
+    one pooled connection, and everything commits (or rolls back) together
+    on exit — one commit per batch instead of one per call.  Nested blocks
+    join the outermost one.
+
+    With ``durable=False`` the commit doesn't wait for the WAL flush
+    (``SET LOCAL synchronous_commit = off``).  Use it only for data that
+    can be re-fetched, such as odds snapshots: a crash may lose the last
+    commit, but never corrupts the database.
+    """
+    if getattr(_tx_local, "conn", None) is not None:
+        yield _tx_local.conn
+        return
+    _tx_local.dirty_tables = set()
+    _tx_local.on_commit = []
+    try:
+        with get_connection() as conn:
+            _tx_local.conn = conn
+            try:
+                if not durable:
+                    with conn.cursor() as cur:
+                        cur.execute("SET LOCAL synchronous_commit = off;")
+                yield conn
+            finally:
+                _tx_local.conn = None
+        # Committed — cached reads of the tables written in the block are stale
+        _invalidate(*_tx_local.dirty_tables)
+        for callback in _tx_local.on_commit:
+            callback()
+    finally:
+        _tx_local.dirty_tables = set()
+        _tx_local.on_commit = []
+
+
+def _on_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the current :func:`transaction` commits, or now outside one."""
+    if getattr(_tx_local, "conn", None) is not None:
+        _tx_local.on_commit.append(callback)
+    else:
+        callback()
+
+
+# Rows fetched per round trip by streaming (server-side) cursors
+_STREAM_ITERSIZE = 10_000
+_stream_ids = count()
+
+
+def _stream_rows(sql: str, params: Sequence[Any] | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Yield dict rows for ``sql`` from a named server-side cursor.
+
+    Rows arrive ``_STREAM_ITERSIZE`` at a time, so memory stays bounded no
+    matter how large the result.  The pooled connection is held until the
+    iterator is exhausted or closed.
+    """
+    with get_connection() as conn:
+        with conn.cursor(
+            name=f"stream_{next(_stream_ids)}",
+            cursor_factory=RealDictCursor,
+        ) as cur:
+            cur.itersize = _STREAM_ITERSIZE
+            cur.execute(sql, params)
+            yield from cur
+
+
+def _fetch_columns(sql: str, params: Sequence[Any] | None = None) -> dict[str, tuple]:
+    """
+    Run ``sql`` and return its result column-wise: ``{column: values}``.
+
+    For results that go straight into a DataFrame — it skips building a
+    dict per row, which dominates the cost of large reads.
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            names = [d.name for d in cur.description]
+            rows = cur.fetchall()
+    if not rows:
+        return dict.fromkeys(names, ())
+    return dict(zip(names, zip(*rows)))
+
+
 def close_pool() -> None:
     """Cleanly shut down the connection pool."""
     global _pool
@@ -62,6 +212,161 @@ def close_pool() -> None:
         logger.info("Database connection pool closed.")
 
 
+# ---------------------------------------------------------------------------
+# Read-through result cache
+# ---------------------------------------------------------------------------
+
+# The dashboard re-runs the same latest-odds / games reads many times between
+# odds pulls.  Results are cached for a few seconds and dropped as soon as a
+# writer in this process commits to one of the tables they read.  Writers in
+# other processes (e.g. the scheduler) are only picked up after the TTL.
+_READ_CACHE_TTL = 10.0
+_READ_CACHE_MAXSIZE = 512
+
+# key -> (expires_at, tables, result)
+_read_cache: OrderedDict[tuple, tuple[float, frozenset[str], Any]] = OrderedDict()
+_read_inflight: dict[tuple, Future] = {}
+_table_generation: dict[str, int] = {}
+_read_cache_lock = threading.RLock()
+
+
+def _copy_result(result: Any) -> Any:
+    """Shallow-copy a cached row / list of rows so callers can't mutate the cache."""
+    if isinstance(result, list):
+        # NamedTuple rows are immutable; only the list needs copying
+        if result and not isinstance(result[0], dict):
+            return list(result)
+        return [dict(r) for r in result]
+    if isinstance(result, dict):
+        return dict(result)
+    return result
+
+
+def _invalidate(*tables: str) -> None:
+    """
+    Drop cached reads that depend on any of ``tables``.
+
+    Inside a :func:`transaction` block this is deferred until the block
+    commits.
+    """
+    if not tables:
+        return
+    dirty = getattr(_tx_local, "dirty_tables", None)
+    if getattr(_tx_local, "conn", None) is not None and dirty is not None:
+        dirty.update(tables)
+        return
+    changed = set(tables)
+    with _read_cache_lock:
+        for table in changed:
+            _table_generation[table] = _table_generation.get(table, 0) + 1
+        for key in [k for k, v in _read_cache.items() if v[1] & changed]:
+            del _read_cache[key]
+
+
+def _cached_read(*tables: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator: cache a reader's result per arguments for ``_READ_CACHE_TTL`` s.
+
+    ``tables`` lists the tables the query reads, for invalidation.  Calls
+    that miss on the same key at the same time share one database round
+    trip.  Reads inside a :func:`transaction` block bypass the cache so
+    they see the block's own uncommitted writes.
+    """
+    deps = frozenset(tables)
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if getattr(_tx_local, "conn", None) is not None:
+                return fn(*args, **kwargs)
+
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            with _read_cache_lock:
+                entry = _read_cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    _read_cache.move_to_end(key)
+                    return _copy_result(entry[2])
+                pending = _read_inflight.get(key)
+                if pending is None:
+                    pending = _read_inflight[key] = Future()
+                    leader = True
+                    generations = {t: _table_generation.get(t, 0) for t in deps}
+                else:
+                    leader = False
+
+            if not leader:
+                return _copy_result(pending.result())
+
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                with _read_cache_lock:
+                    del _read_inflight[key]
+                pending.set_exception(exc)
+                raise
+
+            with _read_cache_lock:
+                del _read_inflight[key]
+                # Don't cache a result that a concurrent write already made stale
+                if all(_table_generation.get(t, 0) == g for t, g in generations.items()):
+                    _read_cache[key] = (time.monotonic() + _READ_CACHE_TTL, deps, result)
+                    _read_cache.move_to_end(key)
+                    while len(_read_cache) > _READ_CACHE_MAXSIZE:
+                        _read_cache.popitem(last=False)
+            pending.set_result(result)
+            return _copy_result(result)
+
+        return wrapper
+
+    return decorator
+
+
+def clear_read_cache() -> None:
+    """Drop every cached read result."""
+    with _read_cache_lock:
+        _read_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Prepared statements for hot single-row writes
+# ---------------------------------------------------------------------------
+
+# name -> PREPARE statement; each is prepared once per pooled connection
+_PREPARED_STATEMENTS: dict[str, str] = {
+    "insert_user_bet_stmt": """
+        PREPARE insert_user_bet_stmt
+            (text, text, text, text, real, text, real, real, real, real) AS
+        INSERT INTO user_bets
+            (game_id, sportsbook, market_type, selection, point,
+             player_name, odds_decimal, stake, ev_at_placement, edge_at_placement)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+        RETURNING id;
+    """,
+    "insert_bankroll_snapshot_stmt": """
+        PREPARE insert_bankroll_snapshot_stmt (real, real, real, real, real, integer) AS
+        INSERT INTO bankroll_history
+            (bankroll, cumulative_profit, total_staked, roi, win_rate, total_bets)
+        VALUES ($1, $2, $3, $4, $5, $6);
+    """,
+}
+
+
+def _execute_prepared(cur: Any, name: str, params: Sequence[Any]) -> None:
+    """
+    Run a statement from ``_PREPARED_STATEMENTS`` via ``EXECUTE``.
+
+    The statement is PREPAREd on the cursor's connection the first time
+    it's used there, so Postgres parses and plans it once per session
+    rather than once per call.
+    """
+    prepared: set[str] = cur.connection.prepared
+    if name not in prepared:
+        cur.execute(_PREPARED_STATEMENTS[name])
+        prepared.add(name)
+    placeholders = ", ".join(["%s"] * len(params))
+    cur.execute(f"EXECUTE {name} ({placeholders});", params)
+
+
 # ---------------------------------------------------------------------------
 # Schema initialisation
 # ---------------------------------------------------------------------------
@@ -93,41 +398,60 @@ def upsert_game(
     status: str = "upcoming",
 ) -> None:
     """Insert a game or update its score / status on conflict."""
-    sql = """
-        INSERT INTO games (game_id, home_team, away_team, commence_time,
-                           home_score, away_score, status)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (game_id) DO UPDATE SET
-            home_score = EXCLUDED.home_score,
-            away_score = EXCLUDED.away_score,
-            status     = EXCLUDED.status;
+    bulk_upsert_games([
+        (game_id, home_team, away_team, commence_time, home_score, away_score, status)
+    ])
+
+
+_UPSERT_GAMES_SQL = b"""
+    INSERT INTO games (game_id, home_team, away_team, commence_time,
+                       home_score, away_score, status)
+    VALUES %s
+    ON CONFLICT (game_id) DO UPDATE SET
+        home_score = EXCLUDED.home_score,
+        away_score = EXCLUDED.away_score,
+        status     = EXCLUDED.status;
+"""
+
+
+def bulk_upsert_games(rows: list[tuple]) -> None:
+    """
+    Insert or update many games in a single statement.
+
+    Each tuple: (game_id, home_team, away_team, commence_time,
+                 home_score, away_score, status)
+
+    ``game_id`` must be unique within ``rows`` — Postgres rejects an
+    ``ON CONFLICT DO UPDATE`` that touches the same row twice.
     """
+    if not rows:
+        return
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                sql,
-                (game_id, home_team, away_team, commence_time,
-                 home_score, away_score, status),
-            )
+            _execute_values(cur, _UPSERT_GAMES_SQL, rows, page_size=500)
+    _invalidate("games")
+    logger.info("Bulk-upserted %d games.", len(rows))
 
 
+@_cached_read("games")
 def get_game(game_id: str) -> dict[str, Any] | None:
     """Fetch a single game by its ID."""
     sql = "SELECT * FROM games WHERE game_id = %s;"
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (game_id,))
             row = cur.fetchone()
-    return dict(row) if row else None
+    return row
 
 
+@_cached_read("games")
 def get_upcoming_games() -> list[dict[str, Any]]:
     """Return all games that have not yet completed."""
     sql = "SELECT * FROM games WHERE status != 'completed' ORDER BY commence_time;"
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql)
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
 # ---------------------------------------------------------------------------
@@ -135,6 +459,12 @@ def get_upcoming_games() -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+_ODDS_COLUMNS: tuple[str, ...] = (
+    "game_id", "sportsbook", "market_type", "selection", "point",
+    "player_name", "odds_decimal", "implied_prob", "snapshot_time",
+)
+
+
 def insert_odds_snapshot(
     game_id: str,
     sportsbook: str,
@@ -146,79 +476,292 @@ def insert_odds_snapshot(
     player_name: str | None = None,
     snapshot_time: datetime | None = None,
 ) -> None:
-    """Store a single odds snapshot row."""
-    sql = """
-        INSERT INTO odds_snapshots
-            (game_id, sportsbook, market_type, selection, point,
-             player_name, odds_decimal, implied_prob, snapshot_time)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()));
     """
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                sql,
-                (game_id, sportsbook, market_type, selection,
-                 point, player_name, odds_decimal, implied_prob, snapshot_time),
-            )
+    Store a single odds snapshot row.
+
+    Thin wrapper over :func:`bulk_insert_odds`; callers storing more than
+    one row should accumulate them and call that directly.
+    """
+    bulk_insert_odds([
+        [game_id], [sportsbook], [market_type], [selection], [point],
+        [player_name], [odds_decimal], [implied_prob],
+        [snapshot_time or datetime.now(timezone.utc)],
+    ])
+
+
+# Below this many rows a single execute_values INSERT beats COPY's setup cost
+_COPY_MIN_ROWS = 1000
+# Rows per VALUES statement; the execute_values default of 100 is small for 9-column rows
+_INSERT_PAGE_SIZE = 1000
+# Rows per COPY; bounds the in-memory CSV buffer for very large batches
+_COPY_CHUNK_ROWS = 50_000
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_values_sql(table: str, column_names: tuple[str, ...]) -> bytes:
+    """``INSERT ... VALUES %s`` for ``execute_values``, built once per table."""
+    return f"INSERT INTO {table} ({', '.join(column_names)}) VALUES %s;".encode()
 
 
-def bulk_insert_odds(rows: list[tuple]) -> None:
+@functools.lru_cache(maxsize=None)
+def _copy_csv_sql(table: str, column_names: tuple[str, ...]) -> str:
+    """``COPY ... FROM STDIN`` (CSV) for ``table``, built once per table."""
+    return f"COPY {table} ({', '.join(column_names)}) FROM STDIN WITH (FORMAT csv)"
+
+
+def _copy_rows(
+    cur: Any, table: str, column_names: Sequence[str], rows: Iterable[tuple]
+) -> int:
     """
-    Bulk-insert odds snapshot rows.
+    Stream ``rows`` into ``table`` with ``COPY ... FROM STDIN``.
 
-    Each tuple: (game_id, sportsbook, market_type, selection, point,
-                 player_name, odds_decimal, implied_prob, snapshot_time)
+    Rows are rendered as CSV ``_COPY_CHUNK_ROWS`` at a time, one COPY per
+    chunk, so memory stays bounded however long ``rows`` is.  Returns the
+    number of rows written.
     """
-    sql = """
-        INSERT INTO odds_snapshots
-            (game_id, sportsbook, market_type, selection, point,
-             player_name, odds_decimal, implied_prob, snapshot_time)
-        VALUES %s;
+    copy_sql = _copy_csv_sql(table, tuple(column_names))
+    rows = iter(rows)
+    total = 0
+    while True:
+        chunk = list(islice(rows, _COPY_CHUNK_ROWS))
+        if not chunk:
+            return total
+        buf = io.StringIO()
+        # None is written as an unquoted empty field, which COPY reads as NULL
+        csv.writer(buf).writerows(chunk)
+        buf.seek(0)
+        cur.copy_expert(copy_sql, buf)
+        total += len(chunk)
+
+
+def _bulk_insert(
+    table: str,
+    column_names: Sequence[str],
+    columns: Sequence[Sequence],
+    n_rows: int,
+) -> None:
     """
-    if not rows:
+    Append column-wise rows to ``table``.
+
+    Large batches are written as CSV into an in-memory buffer and loaded
+    with ``COPY ... FROM STDIN``, which skips per-row SQL parsing, in
+    chunks of ``_COPY_CHUNK_ROWS``.  Small batches use a single
+    ``execute_values`` INSERT instead; it inlines the values client-side,
+    so Postgres's 65535 bind-parameter limit doesn't apply.
+    """
+    rows = zip(*columns)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            if n_rows < _COPY_MIN_ROWS:
+                _execute_values(
+                    cur,
+                    _insert_values_sql(table, tuple(column_names)),
+                    rows,
+                    page_size=_INSERT_PAGE_SIZE,
+                )
+            else:
+                _copy_rows(cur, table, column_names, rows)
+    _invalidate(table)
+
+
+def bulk_insert_odds(columns: Sequence[Sequence]) -> None:
+    """
+    Bulk-insert odds snapshot rows given column-wise (structure of arrays).
+
+    ``columns`` holds one equal-length sequence per column, in order:
+    (game_id, sportsbook, market_type, selection, point,
+     player_name, odds_decimal, implied_prob, snapshot_time)
+
+    ``snapshot_time`` must be filled in by the caller — the column is
+    always sent, so the SQL ``DEFAULT NOW()`` never applies.  Use one
+    timestamp for the whole batch.
+
+    Numeric columns may be numpy arrays.  Large batches are streamed with
+    binary ``COPY`` straight from the columns — rows are encoded one at a
+    time, never collected as a list of tuples.  Small batches go through
+    ``_bulk_insert``.
+    """
+    n_rows = len(columns[0]) if len(columns) else 0
+    if not n_rows:
         return
+    if n_rows < _COPY_MIN_ROWS:
+        _bulk_insert("odds_snapshots", _ODDS_COLUMNS, columns, n_rows)
+    else:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                _copy_odds_binary(cur, zip(*columns))
+        _invalidate("odds_snapshots")
+    logger.info("Bulk-inserted %d odds snapshots.", n_rows)
+
+
+class OddsRow(NamedTuple):
+    """One odds snapshot row, in ``_ODDS_COLUMNS`` order."""
+
+    game_id: str
+    sportsbook: str
+    market_type: str
+    selection: str
+    point: float | None
+    player_name: str | None
+    odds_decimal: float
+    implied_prob: float
+    snapshot_time: datetime
+
+
+# Binary COPY framing (see the PostgreSQL COPY docs, "Binary Format")
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_COPY_BINARY_TRAILER = struct.pack(">h", -1)
+_ODDS_FIELD_COUNT = struct.pack(">h", len(_ODDS_COLUMNS))
+_NULL_FIELD = struct.pack(">i", -1)
+_FLOAT4_FIELD = struct.Struct(">if")  # length prefix + REAL
+_INT8_FIELD = struct.Struct(">iq")    # length prefix + TIMESTAMPTZ (µs since 2000-01-01)
+_LENGTH = struct.Struct(">i")
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def _text_field(value: str) -> bytes:
+    data = value.encode()
+    return _LENGTH.pack(len(data)) + data
+
+
+def _timestamptz_field(value: datetime) -> bytes:
+    if value.tzinfo is None:  # naive timestamps are taken as UTC
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _PG_EPOCH
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return _INT8_FIELD.pack(8, micros)
+
+
+def _encode_odds_row(row: Sequence[Any]) -> bytes:
+    """Encode one odds row as a binary COPY tuple."""
+    game_id, book, market, selection, point, player, odds, prob, snapshot_time = row
+    return b"".join((
+        _ODDS_FIELD_COUNT,
+        _text_field(game_id),
+        _text_field(book),
+        _text_field(market),
+        _text_field(selection),
+        _NULL_FIELD if point is None else _FLOAT4_FIELD.pack(4, point),
+        _NULL_FIELD if player is None else _text_field(player),
+        _FLOAT4_FIELD.pack(4, odds),
+        _FLOAT4_FIELD.pack(4, prob),
+        _timestamptz_field(snapshot_time),
+    ))
+
+
+_COPY_ODDS_BINARY_SQL = (
+    f"COPY odds_snapshots ({', '.join(_ODDS_COLUMNS)}) FROM STDIN WITH (FORMAT binary)"
+)
+
+
+def _copy_odds_binary(cur: Any, rows: Iterable[Sequence[Any]]) -> int:
+    """Stream odds rows into ``odds_snapshots`` with binary COPY; returns the row count."""
+    rows = iter(rows)
+    n_rows = 0
+    while True:
+        chunk = [_encode_odds_row(r) for r in islice(rows, _COPY_CHUNK_ROWS)]
+        if not chunk:
+            return n_rows
+        buf = io.BytesIO(b"".join((_COPY_BINARY_HEADER, *chunk, _COPY_BINARY_TRAILER)))
+        cur.copy_expert(_COPY_ODDS_BINARY_SQL, buf)
+        n_rows += len(chunk)
+
+
+def bulk_copy_odds(rows: Iterable[OddsRow | tuple]) -> int:
+    """
+    COPY odds snapshot rows from any iterable of row tuples.
+
+    Meant for large backfills / history imports: ``rows`` may be a lazy
+    generator of unknown length and is never materialised in full.  Each
+    tuple follows the ``bulk_insert_odds`` column order (see
+    :class:`OddsRow`).  Rows go over the wire in ``FORMAT binary``, so the
+    REAL and TIMESTAMPTZ columns are sent as fixed-width values instead of
+    being formatted to text and re-parsed by the server.  Returns the
+    number of rows written.
+    """
     with get_connection() as conn:
         with conn.cursor() as cur:
-            psycopg2.extras.execute_values(cur, sql, rows)
-    logger.info("Bulk-inserted %d odds snapshots.", len(rows))
+            n_rows = _copy_odds_binary(cur, rows)
+    _invalidate("odds_snapshots")
+    logger.info("COPY-loaded %d odds snapshots.", n_rows)
+    return n_rows
+
+
+# Every filter combination, built once: (has_sportsbook, has_market_type) -> SQL
+_ODDS_HISTORY_SQL: dict[tuple[bool, bool], str] = {
+    (has_book, has_market): (
+        "SELECT * FROM odds_snapshots WHERE game_id = %s"
+        + (" AND sportsbook = %s" if has_book else "")
+        + (" AND market_type = %s" if has_market else "")
+        + " ORDER BY snapshot_time;"
+    )
+    for has_book in (False, True)
+    for has_market in (False, True)
+}
 
 
-def get_odds_history(
+def stream_odds_history(
     game_id: str, sportsbook: str | None = None, market_type: str | None = None
-) -> list[dict[str, Any]]:
-    """Retrieve odds history for a game, optionally filtered by book / market."""
-    clauses = ["game_id = %s"]
-    params: list[Any] = [game_id]
+) -> Iterator[dict[str, Any]]:
+    """Stream odds history for a game in snapshot order, optionally filtered by book / market."""
+    sql = _ODDS_HISTORY_SQL[(bool(sportsbook), bool(market_type))]
+    params = [game_id]
     if sportsbook:
-        clauses.append("sportsbook = %s")
         params.append(sportsbook)
     if market_type:
-        clauses.append("market_type = %s")
         params.append(market_type)
-    sql = (
-        "SELECT * FROM odds_snapshots WHERE "
-        + " AND ".join(clauses)
+    return _stream_rows(sql, params)
+
+
+def get_odds_history(
+    game_id: str, sportsbook: str | None = None, market_type: str | None = None
+) -> list[dict[str, Any]]:
+    """Retrieve odds history for a game, optionally filtered by book / market."""
+    return list(stream_odds_history(game_id, sportsbook, market_type))
+
+
+# Columns the line-movement chart needs, in snapshot order
+_LINE_HISTORY_SQL: dict[bool, str] = {
+    has_book: (
+        "SELECT snapshot_time, sportsbook, market_type, selection, point,"
+        " player_name, odds_decimal, implied_prob"
+        " FROM odds_snapshots WHERE game_id = %s"
+        + (" AND sportsbook = %s" if has_book else "")
         + " ORDER BY snapshot_time;"
     )
-    with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(sql, params)
-            return [dict(r) for r in cur.fetchall()]
+    for has_book in (False, True)
+}
+
+
+def get_odds_history_columns(game_id: str, sportsbook: str | None = None) -> dict[str, tuple]:
+    """
+    Odds history for a game as ``{column: values}``, in snapshot order.
+
+    Columns: snapshot_time, sportsbook, market_type, selection, point,
+    player_name, odds_decimal, implied_prob.
+    """
+    params = [game_id, sportsbook] if sportsbook else [game_id]
+    return _fetch_columns(_LINE_HISTORY_SQL[bool(sportsbook)], params)
 
 
+@_cached_read("odds_snapshots")
 def get_latest_odds(game_id: str) -> list[dict[str, Any]]:
-    """Get the most recent odds per sportsbook / market / selection / player for a game."""
+    """
+    Get the most recent odds per sportsbook / market / selection / player for a game.
+
+    Reads ``latest_odds_snapshots``, which an insert trigger keeps in step
+    with ``odds_snapshots``, instead of sorting the game's full history.
+    The ORDER BY matches ``idx_latest_odds_key`` so no sort step is needed.
+    """
     sql = """
-        SELECT DISTINCT ON (sportsbook, market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, ''))
-            *
-        FROM odds_snapshots
+        SELECT * FROM latest_odds_snapshots
         WHERE game_id = %s
-        ORDER BY sportsbook, market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, ''), snapshot_time DESC;
+        ORDER BY sportsbook, market_type, selection, COALESCE(player_name, ''), COALESCE(point, 'NaN');
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (game_id,))
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +769,12 @@ def get_latest_odds(game_id: str) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+_PINNACLE_COLUMNS: tuple[str, ...] = (
+    "game_id", "market_type", "selection", "point", "player_name",
+    "odds_decimal", "implied_prob", "snapshot_time", "is_closing",
+)
+
+
 def insert_pinnacle_odds(
     game_id: str,
     market_type: str,
@@ -237,62 +786,142 @@ def insert_pinnacle_odds(
     snapshot_time: datetime | None = None,
     is_closing: bool = False,
 ) -> None:
-    """Store a Pinnacle odds row."""
-    sql = """
-        INSERT INTO pinnacle_odds
-            (game_id, market_type, selection, point, player_name,
-             odds_decimal, implied_prob, snapshot_time, is_closing)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()), %s);
     """
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                sql,
-                (game_id, market_type, selection, point, player_name,
-                 odds_decimal, implied_prob, snapshot_time, is_closing),
-            )
+    Store a Pinnacle odds row.
 
-
-def bulk_insert_pinnacle_odds(rows: list[tuple]) -> None:
+    Thin wrapper over :func:`bulk_insert_pinnacle_odds`.
     """
-    Bulk-insert Pinnacle odds rows.
+    bulk_insert_pinnacle_odds([
+        [game_id], [market_type], [selection], [point], [player_name],
+        [odds_decimal], [implied_prob],
+        [snapshot_time or datetime.now(timezone.utc)], [is_closing],
+    ])
+
 
-    Each tuple: (game_id, market_type, selection, point, player_name,
-                 odds_decimal, implied_prob, snapshot_time, is_closing)
+def bulk_insert_pinnacle_odds(columns: Sequence[Sequence]) -> None:
     """
-    sql = """
-        INSERT INTO pinnacle_odds
-            (game_id, market_type, selection, point, player_name,
-             odds_decimal, implied_prob, snapshot_time, is_closing)
-        VALUES %s;
+    Bulk-insert Pinnacle odds rows given column-wise (structure of arrays).
+
+    ``columns`` holds one equal-length sequence per column, in order:
+    (game_id, market_type, selection, point, player_name,
+     odds_decimal, implied_prob, snapshot_time, is_closing)
+
+    As with :func:`bulk_insert_odds`, ``snapshot_time`` must be pre-filled.
     """
-    if not rows:
+    n_rows = len(columns[0]) if columns else 0
+    if not n_rows:
         return
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            psycopg2.extras.execute_values(cur, sql, rows)
-    logger.info("Bulk-inserted %d Pinnacle odds rows.", len(rows))
+    _bulk_insert("pinnacle_odds", _PINNACLE_COLUMNS, columns, n_rows)
+    logger.info("Bulk-inserted %d Pinnacle odds rows.", n_rows)
+
+
+# has_market_type -> SQL
+_LATEST_PINNACLE_SQL: dict[bool, str] = {
+    has_market: (
+        "SELECT * FROM latest_pinnacle_odds WHERE game_id = %s"
+        + (" AND market_type = %s" if has_market else "")
+        + " ORDER BY market_type, selection, COALESCE(player_name, ''), COALESCE(point, 'NaN');"
+    )
+    for has_market in (False, True)
+}
 
 
+@_cached_read("pinnacle_odds")
 def get_latest_pinnacle_odds(
     game_id: str, market_type: str | None = None
 ) -> list[dict[str, Any]]:
     """Most recent Pinnacle line per market / selection / player for a game."""
-    clauses = ["game_id = %s"]
-    params: list[Any] = [game_id]
-    if market_type:
-        clauses.append("market_type = %s")
-        params.append(market_type)
-    sql = (
-        "SELECT DISTINCT ON (market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, '')) * "
-        "FROM pinnacle_odds WHERE "
-        + " AND ".join(clauses)
-        + " ORDER BY market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, ''), snapshot_time DESC;"
-    )
+    sql = _LATEST_PINNACLE_SQL[bool(market_type)]
+    params = (game_id, market_type) if market_type else (game_id,)
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, params)
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
+
+
+def get_latest_pinnacle_line(
+    game_id: str,
+    market_type: str,
+    selection: str,
+    point: float | None = None,
+) -> dict[str, Any] | None:
+    """Most recent Pinnacle row for one exact market / selection / point, or None."""
+    sql = """
+        SELECT * FROM latest_pinnacle_odds
+        WHERE game_id = %s AND market_type = %s AND selection = %s
+          AND point IS NOT DISTINCT FROM %s::real  -- compare at the column's precision
+        ORDER BY snapshot_time DESC
+        LIMIT 1;
+    """
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(sql, (game_id, market_type, selection, point))
+            row = cur.fetchone()
+    return row
+
+
+_BOOK_ROWS_WITH_PINNACLE_SQL = """
+    WITH pin AS (
+        SELECT market_type, selection, point, player_name, odds_decimal,
+               CASE WHEN COUNT(*) OVER w = 2 AND SUM(raw_prob) OVER w > 0
+                    THEN raw_prob / SUM(raw_prob) OVER w
+                    ELSE raw_prob
+               END AS fair_prob
+        FROM (
+            SELECT *,
+                   CASE WHEN odds_decimal > 0 THEN 1.0 / odds_decimal ELSE 0 END AS raw_prob
+            FROM latest_pinnacle_odds
+            WHERE game_id = %(game_id)s
+        ) p
+        WINDOW w AS (PARTITION BY market_type, point, player_name)
+    )
+    SELECT o.sportsbook, o.market_type, o.selection, o.point, o.player_name,
+           o.odds_decimal,
+           pin.odds_decimal AS pin_odds,
+           pin.point        AS pin_point,
+           pin.fair_prob    AS pin_fair_prob
+    FROM latest_odds_snapshots o
+    LEFT JOIN pin
+      ON pin.market_type = o.market_type
+     AND pin.selection = o.selection
+     AND pin.point IS NOT DISTINCT FROM o.point
+     AND pin.player_name IS NOT DISTINCT FROM o.player_name
+    WHERE o.game_id = %(game_id)s
+    ORDER BY o.sportsbook, o.market_type, o.selection,
+             COALESCE(o.player_name, ''), COALESCE(o.point, 'NaN');
+"""
+
+
+class BookOddsRow(NamedTuple):
+    """A latest sportsbook odds row joined to its Pinnacle line."""
+
+    sportsbook: str
+    market_type: str
+    selection: str
+    point: float | None
+    player_name: str | None
+    odds_decimal: float
+    pin_odds: float | None
+    pin_point: float | None
+    pin_fair_prob: float | None
+
+
+@_cached_read("odds_snapshots", "pinnacle_odds")
+def get_book_rows_with_pinnacle(game_id: str) -> list[BookOddsRow]:
+    """
+    Latest odds rows for a game, each joined to its Pinnacle benchmark.
+
+    Rows are the lines of :func:`get_latest_odds`, as compact
+    :class:`BookOddsRow` tuples rather than dicts, plus ``pin_odds``,
+    ``pin_point`` and ``pin_fair_prob`` (None when Pinnacle doesn't quote
+    the line).  ``pin_fair_prob`` is the no-vig probability when the
+    Pinnacle market (market_type, point, player_name) is two-way, else the
+    raw implied probability.
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(_BOOK_ROWS_WITH_PINNACLE_SQL, {"game_id": game_id})
+            return list(map(BookOddsRow._make, cur))
 
 
 def get_closing_pinnacle_odds(game_id: str) -> list[dict[str, Any]]:
@@ -303,9 +932,9 @@ def get_closing_pinnacle_odds(game_id: str) -> list[dict[str, Any]]:
         ORDER BY market_type, selection, player_name;
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (game_id,))
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
 def mark_pinnacle_closing(game_id: str) -> None:
@@ -313,20 +942,35 @@ def mark_pinnacle_closing(game_id: str) -> None:
     Mark the latest Pinnacle odds for a game as the closing line.
     Called when a game transitions to 'live' or 'completed'.
     """
+    bulk_mark_pinnacle_closing([game_id])
+
+
+def bulk_mark_pinnacle_closing(game_ids: list[str]) -> None:
+    """
+    Mark the latest Pinnacle odds as the closing line for several games at once.
+
+    Lines already flagged are skipped, so re-marking a game (completed games
+    keep appearing in the scores feed for days) writes no new tuples.
+    """
     sql = """
-        UPDATE pinnacle_odds
+        WITH closing AS (
+            UPDATE latest_pinnacle_odds
+            SET is_closing = TRUE
+            WHERE game_id = ANY(%s) AND NOT is_closing
+            RETURNING id
+        )
+        UPDATE pinnacle_odds p
         SET is_closing = TRUE
-        WHERE id IN (
-            SELECT DISTINCT ON (market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, '')) id
-            FROM pinnacle_odds
-            WHERE game_id = %s
-            ORDER BY market_type, selection, COALESCE(player_name, ''), COALESCE(point::text, ''), snapshot_time DESC
-        );
+        FROM closing c
+        WHERE p.id = c.id;
     """
+    if not game_ids:
+        return
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, (game_id,))
-    logger.info("Marked closing Pinnacle odds for game %s.", game_id)
+            cur.execute(sql, (list(game_ids),))
+    _invalidate("pinnacle_odds")
+    logger.info("Marked closing Pinnacle odds for %d game(s).", len(game_ids))
 
 
 # ---------------------------------------------------------------------------
@@ -349,24 +993,12 @@ def insert_ev_opportunity(
     benchmark: str = "pinnacle",
 ) -> int:
     """Insert a positive-EV opportunity; returns the new row id."""
-    sql = """
-        INSERT INTO ev_opportunities
-            (game_id, sportsbook, market_type, selection, point, pinnacle_point,
-             player_name, book_odds, pinnacle_odds, ev_percent, edge_percent,
-             benchmark)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id;
-    """
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                sql,
-                (game_id, sportsbook, market_type, selection, point, pinnacle_point,
-                 player_name, book_odds, pinnacle_odds, ev_percent, edge_percent,
-                 benchmark),
-            )
-            row_id: int = cur.fetchone()[0]
-    return row_id
+    return bulk_insert_ev_opportunities(
+        [(game_id, sportsbook, market_type, selection, point, pinnacle_point,
+          player_name, book_odds, pinnacle_odds, ev_percent, edge_percent,
+          benchmark)],
+        live=False,
+    )[0]
 
 
 def clear_live_ev_opportunities() -> None:
@@ -413,6 +1045,57 @@ def insert_ev_opportunity_live(
     return row_id
 
 
+_EV_COLUMNS_SQL = (
+    "game_id, sportsbook, market_type, selection, point, pinnacle_point, "
+    "player_name, book_odds, pinnacle_odds, ev_percent, edge_percent, benchmark"
+)
+
+_INSERT_EV_SQL = f"""
+    INSERT INTO ev_opportunities ({_EV_COLUMNS_SQL})
+    VALUES %s
+    RETURNING id, found_at;
+""".encode()
+
+_INSERT_EV_WITH_LIVE_SQL = f"""
+    WITH hist AS (
+        INSERT INTO ev_opportunities ({_EV_COLUMNS_SQL})
+        VALUES %s
+        RETURNING id, found_at, {_EV_COLUMNS_SQL}
+    ), live AS (
+        INSERT INTO ev_opportunities_live ({_EV_COLUMNS_SQL})
+        SELECT {_EV_COLUMNS_SQL} FROM hist
+    )
+    SELECT id, found_at FROM hist;
+""".encode()
+
+
+def bulk_insert_ev_opportunities(rows: list[tuple], live: bool = True) -> list[int]:
+    """
+    Record many opportunities at once; returns the new history row ids.
+
+    Each tuple: (game_id, sportsbook, market_type, selection, point,
+                 pinnacle_point, player_name, book_odds, pinnacle_odds,
+                 ev_percent, edge_percent, benchmark)
+
+    With ``live`` the rows are also copied into ev_opportunities_live from
+    the history insert's RETURNING in the same statement, so the whole
+    batch — ids included — is one round trip per page.
+    """
+    if not rows:
+        return []
+    sql = _INSERT_EV_WITH_LIVE_SQL if live else _INSERT_EV_SQL
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            returned = _execute_values(
+                cur, sql, rows, page_size=_INSERT_PAGE_SIZE, fetch=True,
+            )
+    latest = max(r[1] for r in returned)
+    _on_commit(lambda: _note_scan_time(latest))
+    if len(rows) > 1:
+        logger.info("Bulk-inserted %d EV opportunities.", len(rows))
+    return [r[0] for r in returned]
+
+
 def get_live_ev_opportunities() -> list[dict[str, Any]]:
     """Get EV opportunities from the live table (most recent scan only)."""
     sql = """
@@ -422,9 +1105,9 @@ def get_live_ev_opportunities() -> list[dict[str, Any]]:
         ORDER BY eo.ev_percent DESC;
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql)
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
 def get_live_ev_opportunities_by_region(preferred_region: str = "ca") -> list[dict[str, Any]]:
@@ -442,9 +1125,9 @@ def get_live_ev_opportunities_by_region(preferred_region: str = "ca") -> list[di
         ORDER BY eo.ev_percent DESC;
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (preferred_region,))
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
 def get_recent_ev_opportunities(hours: int = 24) -> list[dict[str, Any]]:
@@ -453,13 +1136,32 @@ def get_recent_ev_opportunities(hours: int = 24) -> list[dict[str, Any]]:
         SELECT eo.*, g.home_team, g.away_team, g.commence_time
         FROM ev_opportunities eo
         JOIN games g ON g.game_id = eo.game_id
-        WHERE eo.found_at >= NOW() - INTERVAL '%s hours'
+        WHERE eo.found_at >= NOW() - make_interval(hours => %s::int)
         ORDER BY eo.ev_percent DESC;
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (hours,))
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
+
+
+_EV_BY_DATE_SQL = """
+    SELECT eo.*, g.home_team, g.away_team, g.commence_time
+    FROM ev_opportunities eo
+    JOIN games g ON g.game_id = eo.game_id
+    WHERE eo.found_at >= %s AND eo.found_at <= %s
+      AND eo.ev_percent >= %s
+    ORDER BY eo.found_at DESC, eo.ev_percent DESC;
+"""
+
+
+def stream_ev_opportunities_by_date(
+    start_date: datetime,
+    end_date: datetime,
+    min_ev: float = 2.0,
+) -> Iterator[dict[str, Any]]:
+    """Stream historical EV opportunities within a date range, filtered by minimum EV%."""
+    return _stream_rows(_EV_BY_DATE_SQL, (start_date, end_date, min_ev))
 
 
 def get_ev_opportunities_by_date(
@@ -468,49 +1170,77 @@ def get_ev_opportunities_by_date(
     min_ev: float = 2.0,
 ) -> list[dict[str, Any]]:
     """Get historical EV opportunities within a date range, filtered by minimum EV%."""
-    sql = """
-        SELECT eo.*, g.home_team, g.away_team, g.commence_time
-        FROM ev_opportunities eo
-        JOIN games g ON g.game_id = eo.game_id
-        WHERE eo.found_at >= %s AND eo.found_at <= %s
-          AND eo.ev_percent >= %s
-        ORDER BY eo.found_at DESC, eo.ev_percent DESC;
-    """
-    with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(sql, (start_date, end_date, min_ev))
-            return [dict(r) for r in cur.fetchall()]
+    return list(stream_ev_opportunities_by_date(start_date, end_date, min_ev))
+
 
+def get_ev_opportunities_by_date_columns(
+    start_date: datetime,
+    end_date: datetime,
+    min_ev: float = 2.0,
+) -> dict[str, tuple]:
+    """:func:`get_ev_opportunities_by_date` as ``{column: values}``, for DataFrames."""
+    return _fetch_columns(_EV_BY_DATE_SQL, (start_date, end_date, min_ev))
 
+
+@_cached_read("odds_snapshots")
 def get_all_latest_odds_for_game(game_id: str) -> list[dict[str, Any]]:
     """Get the most recent odds from every sportsbook for a game (all markets)."""
     sql = """
-        SELECT DISTINCT ON (sportsbook, market_type, selection,
-                            COALESCE(player_name, ''), COALESCE(point::text, ''))
-            sportsbook, market_type, selection, point, player_name,
-            odds_decimal, implied_prob, snapshot_time
-        FROM odds_snapshots
+        SELECT sportsbook, market_type, selection, point, player_name,
+               odds_decimal, implied_prob, snapshot_time
+        FROM latest_odds_snapshots
         WHERE game_id = %s
         ORDER BY sportsbook, market_type, selection,
-                 COALESCE(player_name, ''), COALESCE(point::text, ''),
-                 snapshot_time DESC;
+                 COALESCE(player_name, ''), COALESCE(point, 'NaN');
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, (game_id,))
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
-def get_last_scan_time() -> datetime | None:
-    """Return the timestamp of the most recent EV opportunity scan."""
+# Newest found_at this process has committed, so its own scans show up
+# without re-probing the history table
+_last_scan_ts: datetime | None = None
+_last_scan_lock = threading.Lock()
+
+
+def _note_scan_time(found_at: datetime) -> None:
+    """Advance ``_last_scan_ts`` to ``found_at`` if it is newer."""
+    global _last_scan_ts
+    with _last_scan_lock:
+        if _last_scan_ts is None or found_at > _last_scan_ts:
+            _last_scan_ts = found_at
+
+
+@_cached_read("ev_opportunities")
+def _probe_last_scan_time() -> datetime | None:
+    """``MAX(found_at)`` over the history table."""
     sql = "SELECT MAX(found_at) AS last_scan FROM ev_opportunities;"
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql)
             row = cur.fetchone()
     return row["last_scan"] if row and row["last_scan"] else None
 
 
+def get_last_scan_time() -> datetime | None:
+    """
+    Return the timestamp of the most recent EV opportunity scan.
+
+    Scans written by this process are tracked in memory.  Scans from other
+    processes (the scheduler, for the dashboard) come from a ``MAX()``
+    probe that is cached for ``_READ_CACHE_TTL`` seconds, so repeated
+    renders cost at most one query per TTL.
+    """
+    probed = _probe_last_scan_time()
+    with _last_scan_lock:
+        local = _last_scan_ts
+    if local is None or probed is None:
+        return local or probed
+    return max(local, probed)
+
+
 # ---------------------------------------------------------------------------
 # User bets
 # ---------------------------------------------------------------------------
@@ -529,17 +1259,10 @@ def insert_user_bet(
     player_name: str | None = None,
 ) -> int:
     """Record a user bet; returns the new row id."""
-    sql = """
-        INSERT INTO user_bets
-            (game_id, sportsbook, market_type, selection, point,
-             player_name, odds_decimal, stake, ev_at_placement, edge_at_placement)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING id;
-    """
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                sql,
+            _execute_prepared(
+                cur, "insert_user_bet_stmt",
                 (game_id, sportsbook, market_type, selection, point,
                  player_name, odds_decimal, stake, ev_at_placement, edge_at_placement),
             )
@@ -555,15 +1278,34 @@ def settle_bet(
     clv: float | None = None,
 ) -> None:
     """Update a bet after the game result is known."""
-    sql = """
-        UPDATE user_bets
-        SET outcome = %s, profit_loss = %s,
-            closing_odds = %s, clv = %s
-        WHERE id = %s;
+    bulk_settle_bets([(bet_id, outcome, profit_loss, closing_odds, clv)])
+
+
+_SETTLE_BETS_SQL = b"""
+    UPDATE user_bets ub
+    SET outcome = v.outcome, profit_loss = v.profit_loss,
+        closing_odds = v.closing_odds, clv = v.clv
+    FROM (VALUES %s) AS v (id, outcome, profit_loss, closing_odds, clv)
+    WHERE ub.id = v.id;
+"""
+# Casts so all-NULL columns (e.g. no closing odds in the batch) still type-check
+_SETTLE_BETS_TEMPLATE = b"(%s::bigint, %s::text, %s::real, %s::real, %s::real)"
+
+
+def bulk_settle_bets(rows: list[tuple]) -> None:
     """
+    Settle many bets in one UPDATE.
+
+    Each tuple: (bet_id, outcome, profit_loss, closing_odds, clv)
+    """
+    if not rows:
+        return
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, (outcome, profit_loss, closing_odds, clv, bet_id))
+            _execute_values(
+                cur, _SETTLE_BETS_SQL, rows,
+                template=_SETTLE_BETS_TEMPLATE, page_size=_INSERT_PAGE_SIZE,
+            )
 
 
 def get_pending_bets() -> list[dict[str, Any]]:
@@ -577,13 +1319,13 @@ def get_pending_bets() -> list[dict[str, Any]]:
         ORDER BY g.commence_time;
     """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql)
-            return [dict(r) for r in cur.fetchall()]
+            return cur.fetchall()
 
 
-def get_all_settled_bets() -> list[dict[str, Any]]:
-    """Return all settled bets for analysis."""
+def stream_all_settled_bets() -> Iterator[dict[str, Any]]:
+    """Stream all settled bets in placement order."""
     sql = """
         SELECT ub.*, g.home_team, g.away_team
         FROM user_bets ub
@@ -591,10 +1333,143 @@ def get_all_settled_bets() -> list[dict[str, Any]]:
         WHERE ub.outcome IS NOT NULL
         ORDER BY ub.placed_at;
     """
+    return _stream_rows(sql)
+
+
+def get_all_settled_bets() -> list[dict[str, Any]]:
+    """Return all settled bets for analysis."""
+    return list(stream_all_settled_bets())
+
+
+def get_settled_bets_version() -> tuple[int | None, int]:
+    """
+    Return (max id, row count) of settled bets.
+
+    A cheap fingerprint that changes whenever another bet settles, for
+    caching frames built from :func:`get_all_settled_bets`.
+    """
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(sql)
-            return [dict(r) for r in cur.fetchall()]
+        with conn.cursor() as cur:
+            cur.execute("SELECT MAX(id), COUNT(*) FROM user_bets WHERE outcome IS NOT NULL;")
+            max_id, n = cur.fetchone()
+    return max_id, n
+
+
+# Aggregates over settled bets, computed server-side so the analysis
+# helpers don't have to pull every row into pandas just to sum it.  Money
+# columns are REAL; SUM(real) accumulates in float4, so they are widened first.
+_SETTLED_SUMMARY_SQL = """
+    SELECT COUNT(*)                                     AS total_bets,
+           COUNT(*) FILTER (WHERE outcome = 'win')      AS wins,
+           COUNT(*) FILTER (WHERE outcome = 'loss')     AS losses,
+           COUNT(*) FILTER (WHERE outcome = 'push')     AS pushes,
+           COALESCE(SUM(stake::float8), 0)              AS total_staked,
+           COALESCE(SUM(profit_loss::float8), 0)        AS total_profit,
+           AVG(odds_decimal)                            AS avg_odds,
+           AVG(ev_at_placement)                         AS avg_ev,
+           AVG(clv)                                     AS avg_clv,
+           (100.0 * COUNT(*) FILTER (WHERE clv > 0)
+                / NULLIF(COUNT(clv), 0))::float8        AS positive_clv_pct
+    FROM user_bets
+    WHERE outcome IS NOT NULL;
+"""
+
+# group column -> breakdown query; the column is never taken from the caller
+_SETTLED_BREAKDOWN_SQL = {
+    column: f"""
+        SELECT {column}, COUNT(*) AS bets, SUM(stake::float8) AS staked,
+               SUM(profit_loss::float8) AS profit,
+               ROUND((SUM(profit_loss::float8) / NULLIF(SUM(stake::float8), 0) * 100)::numeric, 2)::float8
+                   AS roi
+        FROM user_bets
+        WHERE outcome IS NOT NULL
+        GROUP BY {column}
+        ORDER BY roi DESC NULLS LAST;
+    """
+    for column in ("sportsbook", "market_type")
+}
+
+_SETTLED_CLV_BY_BOOK_SQL = """
+    SELECT sportsbook, COUNT(*) AS bets, AVG(clv) AS avg_clv
+    FROM user_bets
+    WHERE outcome IS NOT NULL AND clv IS NOT NULL
+    GROUP BY sportsbook
+    ORDER BY avg_clv DESC;
+"""
+
+# 2%-wide EV buckets, right-closed like pd.cut(bins=range(0, 30, 2))
+_EV_BUCKET_WIDTH = 2
+_EV_BUCKET_MAX = 28
+
+_EV_PROFIT_CORR_SQL = """
+    SELECT COUNT(*) AS n, CORR(ev_at_placement, profit_loss) AS correlation
+    FROM user_bets
+    WHERE outcome IS NOT NULL
+      AND ev_at_placement IS NOT NULL AND profit_loss IS NOT NULL;
+"""
+
+_EV_BUCKETS_SQL = """
+    SELECT CEIL(ev_at_placement / %(width)s)::int AS bucket, COUNT(*) AS count,
+           AVG(ev_at_placement) AS avg_ev, AVG(profit_loss) AS avg_profit
+    FROM user_bets
+    WHERE outcome IS NOT NULL AND profit_loss IS NOT NULL
+      AND ev_at_placement > 0 AND ev_at_placement <= %(max)s
+    GROUP BY 1
+    ORDER BY 1;
+"""
+
+
+def _fetch_dicts(sql: str, params: Any = None) -> list[dict[str, Any]]:
+    """Run a read query and return all rows as dicts."""
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+
+def get_settled_bets_summary() -> dict[str, Any]:
+    """
+    Return counts, totals and averages over all settled bets in one query.
+
+    Keys: total_bets, wins, losses, pushes, total_staked, total_profit,
+    avg_odds, avg_ev, avg_clv, positive_clv_pct (the last four are None
+    with no data).
+    """
+    return _fetch_dicts(_SETTLED_SUMMARY_SQL)[0]
+
+
+def get_settled_roi_breakdown(column: str) -> list[dict[str, Any]]:
+    """
+    Return bets / staked / profit / roi per ``column`` value, best ROI first.
+
+    ``column`` is ``"sportsbook"`` or ``"market_type"``.
+    """
+    try:
+        sql = _SETTLED_BREAKDOWN_SQL[column]
+    except KeyError:
+        raise ValueError(f"Unsupported breakdown column: {column!r}") from None
+    return _fetch_dicts(sql)
+
+
+def get_settled_clv_by_book() -> list[dict[str, Any]]:
+    """Return bet count and average CLV per sportsbook, best CLV first."""
+    return _fetch_dicts(_SETTLED_CLV_BY_BOOK_SQL)
+
+
+def get_ev_vs_profit_stats() -> tuple[int, float | None, list[dict[str, Any]]]:
+    """
+    Return (n_bets, corr(ev, profit), per-bucket rows) for settled bets.
+
+    Bucket rows have keys: bucket (1-based index of the 2%-wide EV bin),
+    count, avg_ev, avg_profit.
+    """
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(_EV_PROFIT_CORR_SQL)
+            overall = cur.fetchone()
+            cur.execute(_EV_BUCKETS_SQL, {"width": _EV_BUCKET_WIDTH, "max": _EV_BUCKET_MAX})
+            buckets = cur.fetchall()
+    return overall["n"], overall["correlation"], buckets
 
 
 # ---------------------------------------------------------------------------
@@ -611,37 +1486,76 @@ def insert_bankroll_snapshot(
     total_bets: int,
 ) -> None:
     """Append a bankroll snapshot row."""
-    sql = """
-        INSERT INTO bankroll_history
-            (bankroll, cumulative_profit, total_staked, roi, win_rate, total_bets)
-        VALUES (%s, %s, %s, %s, %s, %s);
-    """
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                sql,
+            _execute_prepared(
+                cur, "insert_bankroll_snapshot_stmt",
                 (bankroll, cumulative_profit, total_staked,
                  roi, win_rate, total_bets),
             )
+    _invalidate("bankroll_history")
+
+
+def stream_bankroll_history() -> Iterator[dict[str, Any]]:
+    """Stream the full bankroll history in snapshot order."""
+    return _stream_rows("SELECT * FROM bankroll_history ORDER BY snapshot_time;")
 
 
 def get_bankroll_history() -> list[dict[str, Any]]:
     """Full bankroll history for charting."""
-    sql = "SELECT * FROM bankroll_history ORDER BY snapshot_time;"
-    with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-            cur.execute(sql)
-            return [dict(r) for r in cur.fetchall()]
+    return list(stream_bankroll_history())
+
+
+# Every k-th snapshot (k chosen so at most %(max_points)s rows come back),
+# always including the latest one
+_BANKROLL_HISTORY_SAMPLED_SQL = """
+    SELECT snapshot_time, bankroll, cumulative_profit, roi, win_rate, total_bets
+    FROM (
+        SELECT bh.*,
+               ROW_NUMBER() OVER (ORDER BY snapshot_time) AS rn,
+               COUNT(*) OVER () AS n
+        FROM bankroll_history bh
+    ) numbered
+    WHERE n <= %(max_points)s
+       OR rn %% CEIL(n::numeric / %(max_points)s)::bigint = 0
+       OR rn = n
+    ORDER BY snapshot_time;
+"""
+
+
+def get_bankroll_history_columns(max_points: int) -> dict[str, tuple]:
+    """
+    Bankroll history as ``{column: values}``, thinned to about ``max_points`` rows.
+
+    Columns: snapshot_time, bankroll, cumulative_profit, roi, win_rate,
+    total_bets.
+    """
+    return _fetch_columns(_BANKROLL_HISTORY_SAMPLED_SQL, {"max_points": max_points})
+
+
+_CUMULATIVE_PNL_SQL = """
+    SELECT placed_at, profit_loss,
+           SUM(profit_loss::float8) OVER (ORDER BY placed_at, id) AS cumulative_pnl
+    FROM user_bets
+    WHERE outcome IS NOT NULL
+    ORDER BY placed_at, id;
+"""
+
+
+def get_cumulative_pnl_columns() -> dict[str, tuple]:
+    """Settled bets' placed_at, profit_loss and running P&L, in placement order."""
+    return _fetch_columns(_CUMULATIVE_PNL_SQL)
 
 
+@_cached_read("bankroll_history")
 def get_latest_bankroll() -> dict[str, Any] | None:
     """Most recent bankroll snapshot."""
     sql = "SELECT * FROM bankroll_history ORDER BY snapshot_time DESC LIMIT 1;"
     with get_connection() as conn:
-        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql)
             row = cur.fetchone()
-    return dict(row) if row else None
+    return row
 
 
 # ---------------------------------------------------------------------------
@@ -9,22 +9,31 @@ line against Pinnacle to surface positive-EV opportunities.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import Any, Callable
 
-import statistics
+import numpy as np
 
-from src.config import MIN_EV_THRESHOLD, PINNACLE_KEY, PROP_MARKETS, SPORTSBOOKS
+from src.config import (
+    MIN_EV_THRESHOLD,
+    PINNACLE_KEY,
+    SPORTSBOOK_KEYS,
+)
 from src.database import (
+    BookOddsRow,
+    bulk_insert_ev_opportunities,
+    bulk_settle_bets,
     clear_live_ev_opportunities,
+    get_book_rows_with_pinnacle,
     get_closing_pinnacle_odds,
-    get_latest_odds,
-    get_latest_pinnacle_odds,
     get_pending_bets,
     get_upcoming_games,
-    insert_ev_opportunity,
-    insert_ev_opportunity_live,
-    settle_bet,
+    reader_workers,
+    transaction,
 )
+from src.ev_kernels import compute_ev_batch
 
 logger = logging.getLogger(__name__)
 
@@ -80,12 +89,12 @@ def no_vig_probability(odds_side_a: float, odds_side_b: float) -> tuple[float, f
     >>> round(a, 4), round(b, 4)
     (0.5, 0.5)
     """
-    raw_a = implied_probability(odds_side_a)
-    raw_b = implied_probability(odds_side_b)
-    total = raw_a + raw_b
-    if total == 0:
-        return 0.0, 0.0
-    return raw_a / total, raw_b / total
+    if odds_side_a <= 0 or odds_side_b <= 0:
+        # An unpriced side has zero implied probability
+        return float(odds_side_a > 0), float(odds_side_b > 0)
+    # (1/a) / (1/a + 1/b) simplifies to b / (a + b)
+    total = odds_side_a + odds_side_b
+    return odds_side_b / total, odds_side_a / total
 
 
 def calculate_ev(
@@ -179,50 +188,71 @@ def calculate_clv(placed_odds: float, closing_odds: float) -> float:
 # ---------------------------------------------------------------------------
 
 
-def _build_pinnacle_lookup(
-    pinnacle_rows: list[dict[str, Any]],
-) -> dict[tuple, dict[str, Any]]:
+# (market_type, selection, point, player_name) of a dict row (closing lines,
+# bets) or of a BookOddsRow, in one C-level call each
+_line_key = itemgetter("market_type", "selection", "point", "player_name")
+_book_line_key = attrgetter("market_type", "selection", "point", "player_name")
+
+
+def _attach_fair_probabilities(lookup: dict[tuple, dict[str, Any]]) -> None:
     """
-    Build a lookup dict keyed by (market_type, selection, point, player_name)
-    from Pinnacle odds rows so we can quickly match sportsbook lines.
+    Store each benchmark line's fair win probability as ``row["fair_prob"]``.
+
+    Lines grouped by (market_type, point, player_name) that form a two-way
+    market get the no-vig probability; anything else keeps the raw implied
+    probability.
     """
-    lookup: dict[tuple, dict[str, Any]] = {}
-    for row in pinnacle_rows:
-        key = (row["market_type"], row["selection"], row.get("point"), row.get("player_name"))
-        lookup[key] = row
-    return lookup
+    by_market: dict[tuple, list[dict[str, Any]]] = {}
+    for (mtype, _selection, point, player_name), row in lookup.items():
+        row["fair_prob"] = implied_probability(row["odds_decimal"])
+        by_market.setdefault((mtype, point, player_name), []).append(row)
+    for group in by_market.values():
+        if len(group) == 2:
+            side_a, side_b = group
+            side_a["fair_prob"], side_b["fair_prob"] = no_vig_probability(
+                side_a["odds_decimal"], side_b["odds_decimal"]
+            )
 
 
 MIN_BOOKS_FOR_CONSENSUS = 3  # need at least 3 books to form a reliable consensus
 
 
 def _build_consensus_benchmark(
-    book_odds: list[dict[str, Any]],
+    line_keys: list[tuple],
+    line_idx: np.ndarray,
+    book_dec: np.ndarray,
 ) -> dict[tuple, dict[str, Any]]:
     """
     Build a consensus (median) benchmark from sportsbook odds for markets
     that have no Pinnacle line (i.e. player props).
 
-    Groups all sportsbook odds by (market_type, selection, point, player_name),
-    computes the median decimal odds across books, and returns a lookup in
-    the same format as the Pinnacle lookup.
+    ``line_idx`` gives each book row's line as an index into ``line_keys``
+    (the (market_type, selection, point, player_name) tuples) and
+    ``book_dec`` its decimal odds.  The median odds across books are taken
+    per line and returned as a lookup in the same format as the Pinnacle
+    lookup.
 
     Only includes lines where at least MIN_BOOKS_FOR_CONSENSUS sportsbooks
-    offer the same market.
+    offer the same market.  Each entry carries a precomputed ``fair_prob``.
     """
-    # Collect odds per unique line
-    groups: dict[tuple, list[float]] = {}
-    for row in book_odds:
-        if row["sportsbook"] not in SPORTSBOOKS:
-            continue
-        key = (row["market_type"], row["selection"], row.get("point"), row.get("player_name"))
-        groups.setdefault(key, []).append(row["odds_decimal"])
+    counts = np.bincount(line_idx, minlength=len(line_keys))
+    qualifying = np.flatnonzero(counts >= MIN_BOOKS_FOR_CONSENSUS)
+    if not qualifying.size:
+        return {}
+
+    # Scatter the prices into a NaN-padded (lines x books) matrix so every
+    # median is taken in a single nanmedian call
+    order = np.argsort(line_idx, kind="stable")
+    sorted_lines = line_idx[order]
+    starts = np.cumsum(counts) - counts
+    slot = np.arange(len(order)) - starts[sorted_lines]
+    padded = np.full((len(line_keys), counts.max()), np.nan)
+    padded[sorted_lines, slot] = book_dec[order]
+    medians = np.nanmedian(padded[qualifying], axis=1)
 
     lookup: dict[tuple, dict[str, Any]] = {}
-    for key, odds_list in groups.items():
-        if len(odds_list) < MIN_BOOKS_FOR_CONSENSUS:
-            continue
-        median_odds = statistics.median(odds_list)
+    for line_id, median_odds in zip(qualifying.tolist(), medians.tolist()):
+        key = line_keys[line_id]
         lookup[key] = {
             "market_type": key[0],
             "selection": key[1],
@@ -230,11 +260,139 @@ def _build_consensus_benchmark(
             "player_name": key[3],
             "odds_decimal": median_odds,
             "implied_prob": implied_probability(median_odds),
-            "num_books": len(odds_list),
+            "num_books": int(counts[line_id]),
         }
+    _attach_fair_probabilities(lookup)
     return lookup
 
 
+def _line_benchmark(
+    lookup_key: tuple,
+    pin_lookup: dict[tuple, dict[str, Any]],
+    consensus_lookup: dict[tuple, dict[str, Any]],
+) -> tuple[float, float, float | None, str] | None:
+    """
+    Resolve the benchmark for one (market_type, selection, point, player_name) line.
+
+    Pinnacle is used when it quotes the line, otherwise the consensus.
+
+    Returns
+    -------
+    tuple or None
+        (benchmark_odds, fair_probability, benchmark_point, label), or None
+        when neither benchmark covers the line.
+    """
+    if lookup_key in pin_lookup:
+        bench_row, label = pin_lookup[lookup_key], "pinnacle"
+    elif lookup_key in consensus_lookup:
+        bench_row, label = consensus_lookup[lookup_key], "consensus"
+    else:
+        return None
+    return bench_row["odds_decimal"], bench_row["fair_prob"], bench_row.get("point"), label
+
+
+def _scan_game(game_id: str) -> tuple[list[dict[str, Any]], list[tuple]]:
+    """
+    Find a game's +EV lines without storing them.
+
+    Only reads from the database, so games can be scanned concurrently.
+    Returns (opportunity dicts, rows for ``bulk_insert_ev_opportunities``).
+    """
+    # Book rows arrive pre-joined to their Pinnacle line and no-vig price
+    book_odds = get_book_rows_with_pinnacle(game_id)
+
+    # Single pass: intern each distinct line to an integer id and lay the
+    # book rows out as parallel columns; everything after is keyed by id.
+    line_ids: dict[tuple, int] = {}
+    line_keys: list[tuple] = []
+    pin_lookup: dict[tuple, dict[str, Any]] = {}
+    rows: list[BookOddsRow] = []
+    row_line: list[int] = []
+    row_book_dec: list[float] = []
+    for odds_row in book_odds:
+        if odds_row.sportsbook not in SPORTSBOOK_KEYS:
+            continue
+        lookup_key = _book_line_key(odds_row)
+        line_id = line_ids.get(lookup_key)
+        if line_id is None:
+            line_id = line_ids[lookup_key] = len(line_keys)
+            line_keys.append(lookup_key)
+            if odds_row.pin_odds is not None:
+                pin_lookup[lookup_key] = {
+                    "odds_decimal": odds_row.pin_odds,
+                    "fair_prob": odds_row.pin_fair_prob,
+                    "point": odds_row.pin_point,
+                }
+        rows.append(odds_row)
+        row_line.append(line_id)
+        row_book_dec.append(odds_row.odds_decimal)
+
+    if not rows:
+        return [], []
+
+    line_idx = np.asarray(row_line, dtype=np.intp)
+    book_dec = np.asarray(row_book_dec, dtype=np.float64)
+
+    # Consensus benchmark for props (and any market missing Pinnacle)
+    consensus_lookup = _build_consensus_benchmark(line_keys, line_idx, book_dec)
+
+    # Resolve each line's benchmark once
+    line_bench = [_line_benchmark(key, pin_lookup, consensus_lookup) for key in line_keys]
+    bench_by_line = np.asarray([b[0] if b else 0.0 for b in line_bench], dtype=np.float64)
+    fair_by_line = np.asarray([b[1] if b else 0.0 for b in line_bench], dtype=np.float64)
+
+    # EV% = (fair * book - 1) * 100, so a row can only clear the threshold
+    # if book >= (1 + threshold / 100) / fair.  That bound is one compare
+    # per row and prunes most of them (and every line with no benchmark,
+    # whose fair probability is 0) before any EV/edge arithmetic.
+    min_price_by_line = np.full_like(fair_by_line, np.inf)
+    np.divide(1 + MIN_EV_THRESHOLD / 100, fair_by_line,
+              out=min_price_by_line, where=fair_by_line > 0)
+    keep = np.flatnonzero(book_dec >= min_price_by_line[line_idx])
+    kept_lines = line_idx[keep]
+    ev_pct, edge_pct = compute_ev_batch(
+        book_dec[keep], bench_by_line[kept_lines], fair_by_line[kept_lines]
+    )
+
+    opportunities: list[dict[str, Any]] = []
+    rows_to_store: list[tuple] = []
+
+    # Only flagged rows leave the arrays; convert them to Python floats and
+    # round each value once, at emit time
+    flagged = np.flatnonzero(ev_pct >= MIN_EV_THRESHOLD)
+    for i, line_id, ev, edge in zip(
+        keep[flagged].tolist(), kept_lines[flagged].tolist(),
+        ev_pct[flagged].tolist(), edge_pct[flagged].tolist(),
+    ):
+        odds_row = rows[i]
+        bench_dec_i, fair_prob_i, pinnacle_point, bench_label = line_bench[line_id]
+        book_key, book_dec_i = odds_row.sportsbook, odds_row.odds_decimal
+        mtype, selection, point, player_name = line_keys[line_id]
+        ev_r = round(ev, 2)
+        edge_r = round(edge, 2)
+        opp = {
+            "game_id": game_id,
+            "sportsbook": book_key,
+            "market_type": mtype,
+            "selection": selection,
+            "point": point,
+            "player_name": player_name,
+            "book_odds": book_dec_i,
+            "pinnacle_odds": bench_dec_i,
+            "benchmark": bench_label,
+            "ev_percent": ev_r,
+            "edge_percent": edge_r,
+            "fair_probability": round(fair_prob_i, 4),
+        }
+        opportunities.append(opp)
+        rows_to_store.append((
+            game_id, book_key, mtype, selection, point, pinnacle_point,
+            player_name, book_dec_i, bench_dec_i, ev_r, edge_r, bench_label,
+        ))
+
+    return opportunities, rows_to_store
+
+
 def scan_ev_opportunities_for_game(
     game_id: str,
 ) -> list[dict[str, Any]]:
@@ -245,7 +403,10 @@ def scan_ev_opportunities_for_game(
     - **Player props**: benchmark is the consensus (median) line across all
       sportsbooks, since Pinnacle props are unavailable.
 
-    An opportunity is flagged when EV% >= MIN_EV_THRESHOLD.
+    An opportunity is flagged when EV% >= MIN_EV_THRESHOLD.  Fair
+    probabilities are computed once per benchmark line, not per book row;
+    EV and edge are then computed for all book rows at once by
+    :func:`~src.ev_kernels.compute_ev_batch`.
 
     Parameters
     ----------
@@ -257,153 +418,46 @@ def scan_ev_opportunities_for_game(
     list[dict]
         List of opportunity dicts.
     """
-    book_odds = get_latest_odds(game_id)
-    pin_odds = get_latest_pinnacle_odds(game_id)
-
-    # Build Pinnacle lookup for game markets
-    pin_lookup = _build_pinnacle_lookup(pin_odds) if pin_odds else {}
-
-    # Group Pinnacle odds by (market, point, player_name) for no-vig calc
-    pin_by_market: dict[tuple, list[dict]] = {}
-    for row in (pin_odds or []):
-        mkt_key = (row["market_type"], row.get("point"), row.get("player_name"))
-        pin_by_market.setdefault(mkt_key, []).append(row)
-
-    # Build consensus benchmark for props (and any market missing Pinnacle)
-    consensus_lookup = _build_consensus_benchmark(book_odds)
-
-    # Group consensus by (market, point, player_name) for no-vig calc
-    consensus_by_market: dict[tuple, list[dict]] = {}
-    for key, row in consensus_lookup.items():
-        mkt_key = (row["market_type"], row.get("point"), row.get("player_name"))
-        consensus_by_market.setdefault(mkt_key, []).append(row)
-
-    opportunities: list[dict[str, Any]] = []
-
-    for odds_row in book_odds:
-        book_key = odds_row["sportsbook"]
-        if book_key not in SPORTSBOOKS:
-            continue
-
-        mtype = odds_row["market_type"]
-        selection = odds_row["selection"]
-        point = odds_row.get("point")
-        player_name = odds_row.get("player_name")
-        book_dec = odds_row["odds_decimal"]
-
-        lookup_key = (mtype, selection, point, player_name)
-        is_prop = mtype in PROP_MARKETS
-
-        # Choose benchmark: Pinnacle if available (for any market), else consensus
-        pinnacle_point = None
-        if lookup_key in pin_lookup:
-            bench_row = pin_lookup[lookup_key]
-            bench_dec = bench_row["odds_decimal"]
-            pinnacle_point = bench_row.get("point")
-            bench_label = "pinnacle"
-
-            # No-vig fair prob from Pinnacle two-way market
-            fair_prob = implied_probability(bench_dec)
-            market_group_key = (mtype, point, player_name)
-            group = pin_by_market.get(market_group_key, [])
-            if len(group) == 2:
-                sides = sorted(group, key=lambda r: r["selection"])
-                prob_a, prob_b = no_vig_probability(
-                    sides[0]["odds_decimal"], sides[1]["odds_decimal"]
-                )
-                fair_prob = prob_a if selection == sides[0]["selection"] else prob_b
-
-        elif lookup_key in consensus_lookup:
-            bench_row = consensus_lookup[lookup_key]
-            bench_dec = bench_row["odds_decimal"]
-            pinnacle_point = bench_row.get("point")
-            bench_label = "consensus"
-
-            # No-vig fair prob from consensus two-way market
-            fair_prob = implied_probability(bench_dec)
-            market_group_key = (mtype, point, player_name)
-            group = consensus_by_market.get(market_group_key, [])
-            if len(group) == 2:
-                sides = sorted(group, key=lambda r: r["selection"])
-                prob_a, prob_b = no_vig_probability(
-                    sides[0]["odds_decimal"], sides[1]["odds_decimal"]
-                )
-                fair_prob = prob_a if selection == sides[0]["selection"] else prob_b
-        else:
-            continue
-
-        ev_pct = calculate_ev(book_dec, fair_prob)
-        edge_pct = calculate_edge(book_dec, bench_dec)
-
-        if ev_pct >= MIN_EV_THRESHOLD:
-            opp = {
-                "game_id": game_id,
-                "sportsbook": book_key,
-                "market_type": mtype,
-                "selection": selection,
-                "point": point,
-                "player_name": player_name,
-                "book_odds": book_dec,
-                "pinnacle_odds": bench_dec,
-                "benchmark": bench_label,
-                "ev_percent": round(ev_pct, 2),
-                "edge_percent": round(edge_pct, 2),
-                "fair_probability": round(fair_prob, 4),
-            }
-            opportunities.append(opp)
-
-            insert_ev_opportunity(
-                game_id=game_id,
-                sportsbook=book_key,
-                market_type=mtype,
-                selection=selection,
-                book_odds=book_dec,
-                pinnacle_odds=bench_dec,
-                ev_percent=round(ev_pct, 2),
-                edge_percent=round(edge_pct, 2),
-                point=point,
-                pinnacle_point=pinnacle_point,
-                player_name=player_name,
-                benchmark=bench_label,
-            )
-            # Also insert into live opportunities table
-            insert_ev_opportunity_live(
-                game_id=game_id,
-                sportsbook=book_key,
-                market_type=mtype,
-                selection=selection,
-                book_odds=book_dec,
-                pinnacle_odds=bench_dec,
-                ev_percent=round(ev_pct, 2),
-                edge_percent=round(edge_pct, 2),
-                point=point,
-                pinnacle_point=pinnacle_point,
-                player_name=player_name,
-                benchmark=bench_label,
-            )
-
+    opportunities, rows_to_store = _scan_game(game_id)
+    # History + live tables, one round trip for the whole game
+    bulk_insert_ev_opportunities(rows_to_store)
     return opportunities
 
 
-def scan_all_upcoming() -> list[dict[str, Any]]:
+def scan_all_upcoming(games: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
     """
     Scan every upcoming game and return all positive-EV opportunities.
 
     Clears the live opportunities table before inserting new ones.
 
+    Parameters
+    ----------
+    games : list[dict], optional
+        Upcoming game rows, if the caller already has them; fetched with
+        ``get_upcoming_games`` otherwise.
+
     Returns
     -------
     list[dict]
         Combined list of opportunities across all upcoming games.
     """
-    # Clear live opportunities table (in preparation for fresh scan)
-    clear_live_ev_opportunities()
+    if games is None:
+        games = get_upcoming_games()
+    game_ids = [game["game_id"] for game in games]
+    with ThreadPoolExecutor(max_workers=reader_workers(len(game_ids))) as pool:
+        results = list(pool.map(_scan_game, game_ids))
 
-    games = get_upcoming_games()
     all_opps: list[dict[str, Any]] = []
-    for game in games:
-        opps = scan_ev_opportunities_for_game(game["game_id"])
+    rows_to_store: list[tuple] = []
+    for opps, rows in results:
         all_opps.extend(opps)
+        rows_to_store.extend(rows)
+    # One transaction: readers never see the live table half-refreshed, and
+    # the whole scan is written in one bulk insert from this thread.
+    with transaction():
+        # Clear live opportunities table (in preparation for fresh scan)
+        clear_live_ev_opportunities()
+        bulk_insert_ev_opportunities(rows_to_store)
     logger.info("Found %d positive-EV opportunities across %d games.",
                 len(all_opps), len(games))
     return all_opps
@@ -414,6 +468,56 @@ def scan_all_upcoming() -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+_GRADES = ("loss", "push", "win")
+
+
+def _grade(margin: float, odds: float, stake: float) -> tuple[str, float]:
+    """Grade a bet by its margin: > 0 wins, 0 pushes, < 0 loses."""
+    idx = (margin > 0) - (margin < 0) + 1
+    return _GRADES[idx], (-stake, 0.0, stake * (odds - 1))[idx]
+
+
+def _settle_h2h(bet: dict[str, Any], home_score: int, away_score: int) -> tuple[str, float]:
+    """Moneyline: the selection's winning margin."""
+    selection = bet["selection"]
+    if selection == bet["home_team"]:
+        margin = home_score - away_score
+    elif selection == bet["away_team"]:
+        margin = away_score - home_score
+    else:
+        # Not a team in this game — a loss, unless the game was tied (push)
+        margin = -abs(home_score - away_score)
+    return _grade(margin, bet["odds_decimal"], bet["stake"])
+
+
+def _settle_spread(bet: dict[str, Any], home_score: int, away_score: int) -> tuple[str, float]:
+    """Spread: selection is the team; point is the spread for that team."""
+    point = bet.get("point") or 0
+    if bet["selection"] == bet["home_team"]:
+        margin = home_score + point - away_score
+    else:
+        margin = away_score + point - home_score
+    return _grade(margin, bet["odds_decimal"], bet["stake"])
+
+
+def _settle_total(bet: dict[str, Any], home_score: int, away_score: int) -> tuple[str, float]:
+    """Totals: Over wins above the line, Under below it."""
+    point = bet.get("point")
+    if point is None:
+        return "pending", 0.0
+    total = home_score + away_score
+    margin = total - point if bet["selection"] == "Over" else point - total
+    return _grade(margin, bet["odds_decimal"], bet["stake"])
+
+
+# Player props aren't listed: they can't be auto-settled from box scores
+_SETTLERS: dict[str, Callable[[dict[str, Any], int, int], tuple[str, float]]] = {
+    "h2h": _settle_h2h,
+    "spreads": _settle_spread,
+    "totals": _settle_total,
+}
+
+
 def _determine_outcome(
     bet: dict[str, Any],
 ) -> tuple[str, float]:
@@ -425,70 +529,26 @@ def _determine_outcome(
     tuple[str, float]
         (outcome, profit_loss) where profit_loss is positive on a win.
     """
-    market = bet["market_type"]
-    selection = bet["selection"]
     home_score = bet["home_score"]
     away_score = bet["away_score"]
-    odds = bet["odds_decimal"]
-    stake = bet["stake"]
-    point = bet.get("point")
-
     if home_score is None or away_score is None:
         return "pending", 0.0
 
-    # Player props cannot be auto-settled from box scores
-    if market in PROP_MARKETS:
+    settler = _SETTLERS.get(bet["market_type"])
+    if settler is None:
         return "pending", 0.0
+    return settler(bet, home_score, away_score)
 
-    home_team = bet["home_team"]
-    away_team = bet["away_team"]
-
-    if market == "h2h":
-        # Moneyline
-        if home_score > away_score:
-            winner = home_team
-        elif away_score > home_score:
-            winner = away_team
-        else:
-            return "push", 0.0
-
-        if selection == winner:
-            return "win", stake * (odds - 1)
-        return "loss", -stake
-
-    elif market == "spreads":
-        # Selection is the team; point is the spread for that team
-        if selection == home_team:
-            adjusted = home_score + (point or 0)
-            opponent = away_score
-        else:
-            adjusted = away_score + (point or 0)
-            opponent = home_score
-
-        if adjusted > opponent:
-            return "win", stake * (odds - 1)
-        elif adjusted == opponent:
-            return "push", 0.0
-        return "loss", -stake
-
-    elif market == "totals":
-        total = home_score + away_score
-        if point is None:
-            return "pending", 0.0
-        if selection == "Over":
-            if total > point:
-                return "win", stake * (odds - 1)
-            elif total == point:
-                return "push", 0.0
-            return "loss", -stake
-        else:  # Under
-            if total < point:
-                return "win", stake * (odds - 1)
-            elif total == point:
-                return "push", 0.0
-            return "loss", -stake
-
-    return "pending", 0.0
+
+def _closing_lookup(game_id: str) -> dict[tuple, float]:
+    """
+    Pinnacle closing odds for a game keyed by
+    (market_type, selection, point, player_name).
+    """
+    lookup: dict[tuple, float] = {}
+    for row in get_closing_pinnacle_odds(game_id):
+        lookup.setdefault(_line_key(row), row["odds_decimal"])
+    return lookup
 
 
 def settle_pending_bets() -> list[dict[str, Any]]:
@@ -504,43 +564,40 @@ def settle_pending_bets() -> list[dict[str, Any]]:
     pending = get_pending_bets()
     settled: list[dict[str, Any]] = []
 
-    for bet in pending:
-        if bet["game_status"] != "completed":
-            continue
-
-        outcome, pnl = _determine_outcome(bet)
-        if outcome == "pending":
-            continue
-
-        # CLV: compare placed odds to Pinnacle closing odds
-        closing = get_closing_pinnacle_odds(bet["game_id"])
-        closing_odds = None
-        clv = None
-        for cl in closing:
-            if (cl["market_type"] == bet["market_type"]
-                    and cl["selection"] == bet["selection"]
-                    and cl.get("point") == bet.get("point")
-                    and cl.get("player_name") == bet.get("player_name")):
-                closing_odds = cl["odds_decimal"]
+    # Already in commence_time order; the stable sort just makes each
+    # game's bets contiguous so its closing lines are fetched once
+    pending.sort(key=itemgetter("commence_time", "game_id"))
+    for game_id, game_bets in groupby(pending, key=itemgetter("game_id")):
+        closing: dict[tuple, float] | None = None
+        for bet in game_bets:
+            if bet["game_status"] != "completed":
+                continue
+
+            outcome, pnl = _determine_outcome(bet)
+            if outcome == "pending":
+                continue
+
+            # CLV: compare placed odds to Pinnacle closing odds
+            if closing is None:
+                closing = _closing_lookup(game_id)
+            closing_odds = closing.get(_line_key(bet))
+            clv = None
+            if closing_odds is not None:
                 clv = calculate_clv(bet["odds_decimal"], closing_odds)
-                break
-
-        settle_bet(
-            bet_id=bet["id"],
-            outcome=outcome,
-            profit_loss=round(pnl, 2),
-            closing_odds=closing_odds,
-            clv=round(clv, 2) if clv is not None else None,
-        )
-
-        settled.append({
-            "bet_id": bet["id"],
-            "outcome": outcome,
-            "profit_loss": round(pnl, 2),
-            "closing_odds": closing_odds,
-            "clv": round(clv, 2) if clv is not None else None,
-        })
 
+            settled.append({
+                "bet_id": bet["id"],
+                "outcome": outcome,
+                "profit_loss": round(pnl, 2),
+                "closing_odds": closing_odds,
+                "clv": round(clv, 2) if clv is not None else None,
+            })
+
+    # One UPDATE for the whole pass
+    bulk_settle_bets([
+        (r["bet_id"], r["outcome"], r["profit_loss"], r["closing_odds"], r["clv"])
+        for r in settled
+    ])
     if settled:
         logger.info("Settled %d bets.", len(settled))
     return settled
@@ -0,0 +1,260 @@
+"""
+Numeric kernels for the EV scanner and the dashboard/analysis helpers.
+
+Each kernel is compiled with Numba when it is installed, fusing its
+arithmetic into one loop with no temporaries; without Numba it falls back
+to equivalent NumPy array expressions.  For ``compute_ev_batch``, which
+the scheduler runs every cycle, a build made ahead of time with
+``python -m src.ev_kernels`` is preferred over both.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy fallback gives the same results
+    njit = None
+
+
+def _compute_ev_batch_loop(
+    book: np.ndarray, bench: np.ndarray, fair: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute EV% and edge% for parallel float64 arrays of book rows.
+
+    This is the Numba kernel; as plain Python it would be slow, so without
+    Numba :func:`_compute_ev_batch_numpy` is used instead.
+
+    Parameters
+    ----------
+    book : np.ndarray
+        Sportsbook decimal odds.
+    bench : np.ndarray
+        Benchmark (Pinnacle or consensus) decimal odds for each row.
+    fair : np.ndarray
+        Fair win probability for each row.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (ev_pct, edge_pct), matching ``calculate_ev`` and ``calculate_edge``
+        element-wise.
+    """
+    n = book.shape[0]
+    ev = np.empty(n)
+    edge = np.empty(n)
+    for i in range(n):
+        fp = fair[i]
+        ev[i] = (fp * (book[i] - 1.0) - (1.0 - fp)) * 100.0
+        edge[i] = (book[i] / bench[i] - 1.0) * 100.0 if bench[i] > 0.0 else 0.0
+    return ev, edge
+
+
+def _compute_ev_batch_numpy(
+    book: np.ndarray, bench: np.ndarray, fair: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array-expression equivalent of :func:`_compute_ev_batch_loop`."""
+    ev = (fair * (book - 1) - (1 - fair)) * 100
+    ratio = np.divide(book, bench, out=np.ones_like(book), where=bench > 0)
+    return ev, (ratio - 1) * 100
+
+
+# compute_ev_batch(book, bench, fair) -> (ev_pct, edge_pct)
+try:
+    # Ahead-of-time build from ``python -m src.ev_kernels``: no JIT warm-up
+    from src.ev_kernels_aot import compute_ev_batch
+except ImportError:
+    if njit is not None:
+        compute_ev_batch = njit(cache=True, fastmath=True, boundscheck=False)(
+            _compute_ev_batch_loop
+        )
+    else:
+        compute_ev_batch = _compute_ev_batch_numpy
+
+
+def _american_from_decimal_loop(dec: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert decimal odds to integer American odds.
+
+    Parameters
+    ----------
+    dec : np.ndarray
+        Decimal odds (float64); NaN or values <= 1 have no American price.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (american, valid): int64 American odds (0 where invalid) and a
+        bool mask of rows that have a price.  Rounds half-to-even, like
+        ``round`` in ``decimal_to_american``.
+    """
+    n = dec.shape[0]
+    american = np.zeros(n, dtype=np.int64)
+    valid = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        d = dec[i]
+        if d > 1.0:
+            valid[i] = True
+            if d >= 2.0:
+                american[i] = np.int64(np.rint((d - 1.0) * 100.0))
+            else:
+                american[i] = np.int64(np.rint(-100.0 / (d - 1.0)))
+    return american, valid
+
+
+def _american_from_decimal_numpy(dec: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Array-expression equivalent of :func:`_american_from_decimal_loop`."""
+    valid = dec > 1  # False for NaN too
+    d = np.where(valid, dec, 2.0)
+    american = np.where(d >= 2.0, np.rint((d - 1) * 100), np.rint(-100 / (d - 1)))
+    return np.where(valid, american, 0).astype(np.int64), valid
+
+
+def _ev_bucket_sums_loop(
+    ev: np.ndarray, pnl: np.ndarray, edges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-bin count, EV sum and profit sum over right-closed bins.
+
+    Parameters
+    ----------
+    ev : np.ndarray
+        EV at placement per bet (float64, no NaN).
+    pnl : np.ndarray
+        Profit / loss per bet.
+    edges : np.ndarray
+        Increasing float64 bin edges; bin ``i`` is ``(edges[i], edges[i+1]]``
+        as with ``pd.cut``.  Values outside every bin are skipped.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        (count, sum_ev, sum_pnl), each of length ``len(edges) - 1``.
+    """
+    n_bins = edges.shape[0] - 1
+    count = np.zeros(n_bins, dtype=np.int64)
+    sum_ev = np.zeros(n_bins)
+    sum_pnl = np.zeros(n_bins)
+    for i in range(ev.shape[0]):
+        b = np.searchsorted(edges, ev[i]) - 1
+        if 0 <= b < n_bins:
+            count[b] += 1
+            sum_ev[b] += ev[i]
+            sum_pnl[b] += pnl[i]
+    return count, sum_ev, sum_pnl
+
+
+def _ev_bucket_sums_numpy(
+    ev: np.ndarray, pnl: np.ndarray, edges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array-expression equivalent of :func:`_ev_bucket_sums_loop`."""
+    n_bins = len(edges) - 1
+    idx = np.searchsorted(edges, ev) - 1
+    in_range = (idx >= 0) & (idx < n_bins)
+    idx = idx[in_range]
+    return (
+        np.bincount(idx, minlength=n_bins),
+        np.bincount(idx, weights=ev[in_range], minlength=n_bins),
+        np.bincount(idx, weights=pnl[in_range], minlength=n_bins),
+    )
+
+
+def _group_totals_loop(
+    codes: np.ndarray, values: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group row counts and NaN-skipping column sums / counts.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Group index (0 .. n_groups - 1) per row; negative rows are skipped.
+    values : np.ndarray
+        (n_rows, k) float64 values to total per group.
+    n_groups : int
+        Number of groups.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        (rows, sums, counts): rows per group, and (n_groups, k) sums and
+        non-NaN counts per column — ``groupby().size()``, ``.sum()`` and
+        ``.count()``.
+    """
+    n, k = values.shape
+    rows = np.zeros(n_groups, dtype=np.int64)
+    sums = np.zeros((n_groups, k))
+    counts = np.zeros((n_groups, k), dtype=np.int64)
+    for i in range(n):
+        g = codes[i]
+        if g < 0:
+            continue
+        rows[g] += 1
+        for j in range(k):
+            v = values[i, j]
+            if not np.isnan(v):
+                sums[g, j] += v
+                counts[g, j] += 1
+    return rows, sums, counts
+
+
+def _group_totals_numpy(
+    codes: np.ndarray, values: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Array-expression equivalent of :func:`_group_totals_loop`."""
+    keep = codes >= 0
+    codes, values = codes[keep], values[keep]
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    k = values.shape[1]
+    return (
+        np.bincount(codes, minlength=n_groups),
+        np.column_stack([
+            np.bincount(codes, weights=filled[:, j], minlength=n_groups) for j in range(k)
+        ]),
+        np.column_stack([
+            np.bincount(codes, weights=present[:, j], minlength=n_groups) for j in range(k)
+        ]).astype(np.int64),
+    )
+
+
+# american_from_decimal(dec) -> (american, valid)
+# ev_bucket_sums(ev, pnl, edges) -> (count, sum_ev, sum_pnl)
+# group_totals(codes, values, n_groups) -> (rows, sums, counts)
+if njit is not None:
+    # No fastmath: the rounding, bin-edge and NaN checks must match the
+    # pandas code exactly
+    american_from_decimal = njit(cache=True)(_american_from_decimal_loop)
+    ev_bucket_sums = njit(cache=True)(_ev_bucket_sums_loop)
+    group_totals = njit(cache=True)(_group_totals_loop)
+else:
+    american_from_decimal = _american_from_decimal_numpy
+    ev_bucket_sums = _ev_bucket_sums_numpy
+    group_totals = _group_totals_numpy
+
+
+_AOT_SIGNATURE = "UniTuple(f8[:], 2)(f8[:], f8[:], f8[:])"
+
+
+def build_aot(output_dir: str | Path | None = None) -> None:
+    """
+    Compile ``compute_ev_batch`` into the ``src.ev_kernels_aot`` extension.
+
+    Run once per deploy (``python -m src.ev_kernels``) so the scheduler's
+    first scan after a restart doesn't pay Numba's JIT compile time.
+    Requires numba.
+    """
+    from numba.pycc import CC
+
+    cc = CC("ev_kernels_aot")
+    cc.output_dir = str(output_dir or Path(__file__).parent)
+    cc.export("compute_ev_batch", _AOT_SIGNATURE)(_compute_ev_batch_loop)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build_aot()
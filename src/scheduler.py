@@ -13,6 +13,10 @@ Start the scheduler with ``start_scheduler()`` or run this file directly.
 from __future__ import annotations
 
 import logging
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -24,7 +28,7 @@ from src.alerts import (
 )
 from src.config import LINE_MOVEMENT_THRESHOLD, POLL_INTERVAL_MINUTES
 from src.data_fetching import pull_and_store_latest
-from src.database import get_upcoming_games
+from src.database import get_upcoming_games, reader_workers
 from src.ev_calculation import scan_all_upcoming, settle_pending_bets
 from src.strategy_analysis import (
     detect_significant_movements,
@@ -50,10 +54,10 @@ def job_pull_odds() -> None:
         logger.exception("Error in scheduled odds pull.")
 
 
-def job_scan_ev() -> None:
+def job_scan_ev(games: list[dict[str, Any]] | None = None) -> None:
     """Scheduled job: scan for +EV opportunities and alert."""
     try:
-        opps = scan_all_upcoming()
+        opps = scan_all_upcoming(games)
         if opps:
             alert_batch_ev_opportunities(opps)
     except Exception:
@@ -71,14 +75,21 @@ def job_settle_and_update() -> None:
         logger.exception("Error in settle/update job.")
 
 
-def job_line_movement_alerts() -> None:
+def job_line_movement_alerts(games: list[dict[str, Any]] | None = None) -> None:
     """Scheduled job: detect big line moves and alert."""
     try:
-        games = get_upcoming_games()
-        for game in games:
-            movements = detect_significant_movements(
+        if games is None:
+            games = get_upcoming_games()
+
+        def _detect(game: dict[str, Any]) -> list[dict[str, Any]]:
+            return detect_significant_movements(
                 game["game_id"], threshold_pct=LINE_MOVEMENT_THRESHOLD
             )
+
+        # Each game's history read is independent — overlap their latency
+        with ThreadPoolExecutor(max_workers=reader_workers(len(games))) as pool:
+            all_movements = list(pool.map(_detect, games))
+        for game, movements in zip(games, all_movements):
             label = f"{game['away_team']} @ {game['home_team']}"
             for mv in movements:
                 alert_line_movement(mv, game_label=label)
@@ -86,6 +97,24 @@ def job_line_movement_alerts() -> None:
         logger.exception("Error in line movement job.")
 
 
+def job_cycle() -> None:
+    """
+    Scheduled job: pull odds, then scan for EV and check line movements.
+
+    The steps run back to back, so the scan and the movement checks always
+    see the odds just pulled and share one read of the upcoming games.
+    Each step logs its own errors without stopping the ones after it.
+    """
+    job_pull_odds()
+    try:
+        games = get_upcoming_games()
+    except Exception:
+        logger.exception("Error loading upcoming games.")
+        return
+    job_scan_ev(games)
+    job_line_movement_alerts(games)
+
+
 # ---------------------------------------------------------------------------
 # Scheduler lifecycle
 # ---------------------------------------------------------------------------
@@ -102,20 +131,12 @@ def start_scheduler() -> BackgroundScheduler:
     _scheduler = BackgroundScheduler()
     interval = POLL_INTERVAL_MINUTES
 
+    # Pull → scan → line movements as one pipelined job
     _scheduler.add_job(
-        job_pull_odds,
+        job_cycle,
         trigger=IntervalTrigger(minutes=interval),
-        id="pull_odds",
-        name="Pull odds & scores",
-        replace_existing=True,
-    )
-
-    # Scan EV 1 minute after each pull
-    _scheduler.add_job(
-        job_scan_ev,
-        trigger=IntervalTrigger(minutes=interval),
-        id="scan_ev",
-        name="Scan EV opportunities",
+        id="odds_cycle",
+        name="Pull odds, scan EV, line movement alerts",
         replace_existing=True,
     )
 
@@ -128,15 +149,6 @@ def start_scheduler() -> BackgroundScheduler:
         replace_existing=True,
     )
 
-    # Line movement checks at the same cadence as odds pulls
-    _scheduler.add_job(
-        job_line_movement_alerts,
-        trigger=IntervalTrigger(minutes=interval),
-        id="line_movements",
-        name="Line movement alerts",
-        replace_existing=True,
-    )
-
     _scheduler.start()
     logger.info(
         "Scheduler started — polling every %d min.", interval
@@ -152,24 +164,33 @@ def stop_scheduler() -> None:
         logger.info("Scheduler stopped.")
 
 
+def wait_until_interrupted() -> None:
+    """
+    Block the calling (main) thread until SIGINT / SIGTERM arrives.
+
+    Sleeps on an Event instead of polling, so the idle process never
+    wakes up just to check for Ctrl+C.
+    """
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    stop.wait()
+
+
 # ---------------------------------------------------------------------------
 # Standalone execution
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    import time
-
     logging.basicConfig(level=logging.INFO)
     sched = start_scheduler()
 
-    # Run an immediate pull on startup
-    job_pull_odds()
-    job_scan_ev()
+    # Run an immediate cycle on startup
+    job_cycle()
 
     print("Scheduler running. Press Ctrl+C to stop.")
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        wait_until_interrupted()
+    finally:
         stop_scheduler()
         print("Stopped.")
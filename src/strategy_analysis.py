@@ -9,6 +9,9 @@ sportsbook-level comparisons.
 from __future__ import annotations
 
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -17,11 +20,19 @@ import pandas as pd
 from src.config import STARTING_BANKROLL
 from src.database import (
     get_all_settled_bets,
-    get_bankroll_history,
+    get_cumulative_pnl_columns,
+    get_bankroll_history_columns,
+    get_ev_vs_profit_stats,
     get_latest_bankroll,
-    get_odds_history,
+    get_odds_history_columns,
+    get_settled_bets_summary,
+    get_settled_clv_by_book,
+    get_settled_bets_version,
+    get_settled_roi_breakdown,
     insert_bankroll_snapshot,
+    stream_odds_history,
 )
+from src.ev_kernels import ev_bucket_sums, group_totals
 
 logger = logging.getLogger(__name__)
 
@@ -31,31 +42,170 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def settled_bets_df() -> pd.DataFrame:
-    """
-    Load all settled bets into a DataFrame for analysis.
+# Low-cardinality text columns stored as categoricals, and REAL columns kept
+# at their database precision instead of widening to float64.  The money
+# columns (stake, profit_loss) stay float64: totals, ROI and the equity curve
+# sum them over every bet, and float32 sums drift visibly in dollar terms.
+_CATEGORY_COLUMNS = ("sportsbook", "market_type", "selection", "outcome", "home_team", "away_team")
+_FLOAT32_COLUMNS = [
+    "odds_decimal", "ev_at_placement", "edge_at_placement", "closing_odds", "clv",
+]
+
+
+# Last built frame, reused across processes (dashboard cold starts, CLI runs)
+# while the settled-bets fingerprint stored with it still matches.
+_SETTLED_BETS_CACHE_PATH = Path(__file__).resolve().parent.parent / ".settled_bets.parquet"
+# Bumped whenever the frame's dtypes change, so older cache files are rebuilt
+_SETTLED_CACHE_FORMAT = 2
+
+
+def _read_settled_cache(version: tuple[int | None, int]) -> pd.DataFrame | None:
+    """Return the cached frame if it was written for ``version``."""
+    try:
+        df = pd.read_parquet(_SETTLED_BETS_CACHE_PATH)
+    except FileNotFoundError:
+        return None
+    except (ImportError, OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable settled-bets cache %s: %s",
+                       _SETTLED_BETS_CACHE_PATH, exc)
+        return None
+    if (
+        df.attrs.get("cache_format") != _SETTLED_CACHE_FORMAT
+        or tuple(df.attrs.get("settled_version", ())) != version
+    ):
+        return None
+    return df
 
-    Columns include: id, game_id, sportsbook, market_type, selection,
-    odds_decimal, stake, ev_at_placement, edge_at_placement, placed_at,
-    outcome, profit_loss, closing_odds, clv, home_team, away_team.
-    """
+
+def _write_settled_cache(df: pd.DataFrame) -> None:
+    """Persist ``df`` (tagged with its version); best effort, since it is only a cache."""
+    tmp = _SETTLED_BETS_CACHE_PATH.with_name(f"{_SETTLED_BETS_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp, compression="zstd")
+        tmp.replace(_SETTLED_BETS_CACHE_PATH)
+    except (ImportError, OSError, ValueError) as exc:
+        logger.warning("Could not write settled-bets cache %s: %s",
+                       _SETTLED_BETS_CACHE_PATH, exc)
+
+
+def _build_settled_bets_df() -> pd.DataFrame:
+    """Query every settled bet into a compactly typed frame."""
     rows = get_all_settled_bets()
     if not rows:
         return pd.DataFrame()
     df = pd.DataFrame(rows)
     df["placed_at"] = pd.to_datetime(df["placed_at"])
+    for col in _CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    df[_FLOAT32_COLUMNS] = df[_FLOAT32_COLUMNS].astype("float32")
+    df["id"] = pd.to_numeric(df["id"], downcast="unsigned")
     return df
 
 
+@lru_cache(maxsize=1)
+def _load_settled_bets_df(version: tuple[int | None, int]) -> pd.DataFrame:
+    """Build the settled-bets frame; cached per :func:`get_settled_bets_version`."""
+    df = _read_settled_cache(version)
+    if df is None:
+        df = _build_settled_bets_df()
+        df.attrs["settled_version"] = list(version)
+        df.attrs["cache_format"] = _SETTLED_CACHE_FORMAT
+        if not df.empty:
+            _write_settled_cache(df)
+    return df
+
+
+def settled_bets_df(columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Load all settled bets into a DataFrame for analysis.
+
+    Columns include: id, game_id, sportsbook, market_type, selection,
+    odds_decimal, stake, ev_at_placement, edge_at_placement, placed_at,
+    outcome, profit_loss, closing_odds, clv, home_team, away_team.
+
+    The frame is rebuilt only when the settled-bet count or max id
+    changes; callers get a copy they are free to modify.  That
+    fingerprint is available as :func:`settled_bets_key`.
+
+    Parameters
+    ----------
+    columns : list[str], optional
+        Copy only these columns instead of the whole frame.
+    """
+    df = _load_settled_bets_df(get_settled_bets_version())
+    if columns is None:
+        return df.copy()
+    # With no settled bets the cached frame has no columns at all
+    return df.reindex(columns=columns) if df.empty else df[columns]
+
+
+def settled_bets_key(df: pd.DataFrame) -> tuple:
+    """
+    Cache key for a frame from :func:`settled_bets_df`.
+
+    The (max id, count) fingerprint it was built for — constant-time, unlike
+    hashing the frame's contents.
+    """
+    return tuple(df.attrs.get("settled_version", ()))
+
+
+# ---------------------------------------------------------------------------
+# Empty results
+# ---------------------------------------------------------------------------
+
+# What the analyses return when there are no (usable) settled bets.  Built
+# per call so a caller mutating one result can't affect the next.
+_ROI_COLUMNS = ["bets", "staked", "profit", "roi"]
+_PNL_COLUMNS = ["placed_at", "profit_loss", "cumulative_pnl"]
+
+
+def _empty_ev_correlation() -> dict[str, Any]:
+    """:func:`ev_vs_actual_correlation` result with nothing to correlate."""
+    return {"correlation": 0.0, "ev_buckets": pd.DataFrame()}
+
+
+def _empty_clv_analysis() -> dict[str, Any]:
+    """:func:`clv_analysis` result with no closing-line data."""
+    return {"avg_clv": 0.0, "positive_clv_pct": 0.0, "clv_by_book": pd.DataFrame()}
+
+
 # ---------------------------------------------------------------------------
 # Cumulative statistics
 # ---------------------------------------------------------------------------
 
 
+def _settled_totals(df: pd.DataFrame) -> dict[str, Any]:
+    """Pandas equivalent of :func:`get_settled_bets_summary` for a given frame."""
+    counts = df["outcome"].value_counts()
+    means = [c for c in ("odds_decimal", "ev_at_placement", "clv") if c in df]
+    agg = df.agg({"stake": "sum", "profit_loss": "sum", **dict.fromkeys(means, "mean")})
+    return {
+        "total_bets": len(df),
+        "wins": counts.get("win", 0),
+        "losses": counts.get("loss", 0),
+        "pushes": counts.get("push", 0),
+        "total_staked": agg["stake"],
+        "total_profit": agg["profit_loss"],
+        "avg_odds": agg.get("odds_decimal"),
+        "avg_ev": agg.get("ev_at_placement"),
+        "avg_clv": agg.get("clv"),
+    }
+
+
+def _round_or_zero(value: float | None, ndigits: int) -> float:
+    """Round an average that may be missing (None / NaN) to ``ndigits``."""
+    if value is None or np.isnan(value):
+        return 0.0
+    return round(float(value), ndigits)
+
+
 def compute_cumulative_stats(df: pd.DataFrame | None = None) -> dict[str, Any]:
     """
     Compute cumulative performance metrics from settled bets.
 
+    Without ``df`` the totals are aggregated in the database rather than
+    over a DataFrame of every settled bet.
+
     Returns
     -------
     dict with keys:
@@ -63,9 +213,13 @@ def compute_cumulative_stats(df: pd.DataFrame | None = None) -> dict[str, Any]:
         total_profit, roi, avg_odds, avg_ev, avg_clv, bankroll.
     """
     if df is None:
-        df = settled_bets_df()
+        totals = get_settled_bets_summary()
+    elif df.empty:
+        totals = {"total_bets": 0}
+    else:
+        totals = _settled_totals(df)
 
-    if df.empty:
+    if not totals["total_bets"]:
         return {
             "total_bets": 0, "wins": 0, "losses": 0, "pushes": 0,
             "win_rate": 0.0, "total_staked": 0.0, "total_profit": 0.0,
@@ -73,36 +227,29 @@ def compute_cumulative_stats(df: pd.DataFrame | None = None) -> dict[str, Any]:
             "bankroll": STARTING_BANKROLL,
         }
 
-    wins = (df["outcome"] == "win").sum()
-    losses = (df["outcome"] == "loss").sum()
-    pushes = (df["outcome"] == "push").sum()
-    total = len(df)
+    wins, losses = int(totals["wins"]), int(totals["losses"])
     decided = wins + losses  # exclude pushes from win-rate calc
 
-    total_staked = df["stake"].sum()
-    total_profit = df["profit_loss"].sum()
+    total_staked = float(totals["total_staked"])
+    total_profit = float(totals["total_profit"])
     roi = (total_profit / total_staked * 100) if total_staked else 0.0
     win_rate = (wins / decided * 100) if decided else 0.0
 
-    avg_odds = df["odds_decimal"].mean()
-    avg_ev = df["ev_at_placement"].dropna().mean() if "ev_at_placement" in df else 0.0
-    avg_clv = df["clv"].dropna().mean() if "clv" in df else 0.0
-
     bankroll_row = get_latest_bankroll()
     bankroll = bankroll_row["bankroll"] if bankroll_row else STARTING_BANKROLL + total_profit
 
     return {
-        "total_bets": int(total),
-        "wins": int(wins),
-        "losses": int(losses),
-        "pushes": int(pushes),
+        "total_bets": int(totals["total_bets"]),
+        "wins": wins,
+        "losses": losses,
+        "pushes": int(totals["pushes"]),
         "win_rate": round(win_rate, 2),
         "total_staked": round(total_staked, 2),
         "total_profit": round(total_profit, 2),
         "roi": round(roi, 2),
-        "avg_odds": round(avg_odds, 3) if not np.isnan(avg_odds) else 0.0,
-        "avg_ev": round(avg_ev, 2) if not np.isnan(avg_ev) else 0.0,
-        "avg_clv": round(avg_clv, 2) if not np.isnan(avg_clv) else 0.0,
+        "avg_odds": _round_or_zero(totals["avg_odds"], 3),
+        "avg_ev": _round_or_zero(totals["avg_ev"], 2),
+        "avg_clv": _round_or_zero(totals["avg_clv"], 2),
         "bankroll": round(bankroll, 2),
     }
 
@@ -111,9 +258,10 @@ def update_bankroll_snapshot() -> dict[str, Any]:
     """
     Compute latest cumulative stats and persist a bankroll snapshot.
 
-    Returns the stats dict.
+    Returns the stats dict.  Also refreshes the on-disk settled-bets
+    cache, so the dashboard's next load doesn't have to query every bet.
     """
-    stats = compute_cumulative_stats()
+    stats = compute_cumulative_stats(settled_bets_df())
     insert_bankroll_snapshot(
         bankroll=stats["bankroll"],
         cumulative_profit=stats["total_profit"],
@@ -132,41 +280,61 @@ def update_bankroll_snapshot() -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def roi_by_sportsbook(df: pd.DataFrame | None = None) -> pd.DataFrame:
-    """
-    Calculate ROI and record count broken down by sportsbook.
-
-    Returns a DataFrame with columns: sportsbook, bets, staked,
-    profit, roi.
-    """
+def _roi_breakdown(df: pd.DataFrame | None, column: str) -> pd.DataFrame:
+    """ROI per ``column`` value — in SQL without ``df``, else with pandas."""
     if df is None:
-        df = settled_bets_df()
+        return pd.DataFrame(get_settled_roi_breakdown(column), columns=[column, *_ROI_COLUMNS])
     if df.empty:
-        return pd.DataFrame(columns=["sportsbook", "bets", "staked", "profit", "roi"])
+        return pd.DataFrame(columns=[column, *_ROI_COLUMNS])
 
-    grouped = df.groupby("sportsbook").agg(
+    grouped = df.groupby(column, observed=True).agg(
         bets=("id", "count"),
         staked=("stake", "sum"),
         profit=("profit_loss", "sum"),
     ).reset_index()
+    return _with_roi(grouped)
+
+
+def _with_roi(grouped: pd.DataFrame) -> pd.DataFrame:
+    """Add ``roi`` to per-group bets / staked / profit totals, best first."""
     grouped["roi"] = (grouped["profit"] / grouped["staked"] * 100).round(2)
     return grouped.sort_values("roi", ascending=False)
 
 
+def roi_by_sportsbook(df: pd.DataFrame | None = None) -> pd.DataFrame:
+    """
+    Calculate ROI and record count broken down by sportsbook.
+
+    Returns a DataFrame with columns: sportsbook, bets, staked,
+    profit, roi.
+    """
+    return _roi_breakdown(df, "sportsbook")
+
+
 def roi_by_market(df: pd.DataFrame | None = None) -> pd.DataFrame:
     """ROI breakdown by market type (h2h, spreads, totals)."""
-    if df is None:
-        df = settled_bets_df()
-    if df.empty:
-        return pd.DataFrame(columns=["market_type", "bets", "staked", "profit", "roi"])
+    return _roi_breakdown(df, "market_type")
 
-    grouped = df.groupby("market_type").agg(
-        bets=("id", "count"),
-        staked=("stake", "sum"),
-        profit=("profit_loss", "sum"),
-    ).reset_index()
-    grouped["roi"] = (grouped["profit"] / grouped["staked"] * 100).round(2)
-    return grouped.sort_values("roi", ascending=False)
+
+# Right-closed 2% EV bins, matching the database's bucket numbering
+_EV_BIN_EDGES = np.arange(0, 30, 2)
+_EV_BINS = pd.IntervalIndex.from_breaks(_EV_BIN_EDGES)
+
+
+def ev_profit_correlation(ev: np.ndarray, pnl: np.ndarray) -> float:
+    """
+    Pearson correlation of EV at placement with profit / loss.
+
+    Rows where either value is NaN are dropped.  As in
+    :func:`ev_vs_actual_correlation`, the result is rounded to 4 places and
+    is 0.0 with fewer than 3 bets or zero variance.
+    """
+    keep = ~(np.isnan(ev) | np.isnan(pnl))
+    if np.count_nonzero(keep) < 3:
+        return 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):  # zero variance -> NaN
+        corr = np.corrcoef(ev[keep], pnl[keep])[0, 1]
+    return round(float(corr), 4) if not np.isnan(corr) else 0.0
 
 
 def ev_vs_actual_correlation(df: pd.DataFrame | None = None) -> dict[str, Any]:
@@ -179,26 +347,39 @@ def ev_vs_actual_correlation(df: pd.DataFrame | None = None) -> dict[str, Any]:
     vs avg actual ROI).
     """
     if df is None:
-        df = settled_bets_df()
-    if df.empty or "ev_at_placement" not in df.columns:
-        return {"correlation": 0.0, "ev_buckets": pd.DataFrame()}
-
-    valid = df.dropna(subset=["ev_at_placement", "profit_loss"]).copy()
-    if len(valid) < 3:
-        return {"correlation": 0.0, "ev_buckets": pd.DataFrame()}
-
-    corr = valid["ev_at_placement"].corr(valid["profit_loss"])
-
-    # Bucket EV into 2% bins
-    valid["ev_bin"] = pd.cut(valid["ev_at_placement"], bins=range(0, 30, 2))
-    buckets = valid.groupby("ev_bin", observed=True).agg(
-        count=("id", "count"),
-        avg_ev=("ev_at_placement", "mean"),
-        avg_profit=("profit_loss", "mean"),
-    ).reset_index()
+        n, corr, bucket_rows = get_ev_vs_profit_stats()
+        if n < 3:
+            return _empty_ev_correlation()
+        buckets = pd.DataFrame(bucket_rows, columns=["bucket", "count", "avg_ev", "avg_profit"])
+        buckets.insert(0, "ev_bin", _EV_BINS[buckets.pop("bucket").to_numpy(dtype=int) - 1])
+        corr = round(corr, 4) if corr is not None and not np.isnan(corr) else 0.0
+    else:
+        if df.empty or "ev_at_placement" not in df.columns:
+            return _empty_ev_correlation()
+
+        valid = df.loc[
+            df["ev_at_placement"].notna() & df["profit_loss"].notna(),
+            ["ev_at_placement", "profit_loss"],
+        ]
+        if len(valid) < 3:
+            return _empty_ev_correlation()
+
+        ev = valid["ev_at_placement"].to_numpy(dtype=float)
+        pnl = valid["profit_loss"].to_numpy(dtype=float)
+        corr = ev_profit_correlation(ev, pnl)
+
+        # Values outside (0, 28] fall in no bin, as with pd.cut
+        count, sum_ev, sum_pnl = ev_bucket_sums(ev, pnl, _EV_BIN_EDGES.astype(float))
+        hit = count > 0
+        buckets = pd.DataFrame({
+            "ev_bin": _EV_BINS[hit],
+            "count": count[hit],
+            "avg_ev": sum_ev[hit] / count[hit],
+            "avg_profit": sum_pnl[hit] / count[hit],
+        })
 
     return {
-        "correlation": round(corr, 4) if not np.isnan(corr) else 0.0,
+        "correlation": corr,
         "ev_buckets": buckets,
     }
 
@@ -212,23 +393,27 @@ def clv_analysis(df: pd.DataFrame | None = None) -> dict[str, Any]:
     dict with keys: avg_clv, positive_clv_pct, clv_by_book (DataFrame).
     """
     if df is None:
-        df = settled_bets_df()
-    if df.empty or "clv" not in df.columns:
-        return {"avg_clv": 0.0, "positive_clv_pct": 0.0,
-                "clv_by_book": pd.DataFrame()}
-
-    valid = df.dropna(subset=["clv"])
-    if valid.empty:
-        return {"avg_clv": 0.0, "positive_clv_pct": 0.0,
-                "clv_by_book": pd.DataFrame()}
-
-    avg_clv = valid["clv"].mean()
-    pos_pct = (valid["clv"] > 0).mean() * 100
-
-    by_book = valid.groupby("sportsbook").agg(
-        bets=("id", "count"),
-        avg_clv=("clv", "mean"),
-    ).reset_index().sort_values("avg_clv", ascending=False)
+        summary = get_settled_bets_summary()
+        if summary["avg_clv"] is None:
+            return _empty_clv_analysis()
+        avg_clv = summary["avg_clv"]
+        pos_pct = summary["positive_clv_pct"]
+        by_book = pd.DataFrame(get_settled_clv_by_book(), columns=["sportsbook", "bets", "avg_clv"])
+    else:
+        if df.empty or "clv" not in df.columns:
+            return _empty_clv_analysis()
+
+        valid = df.dropna(subset=["clv"])
+        if valid.empty:
+            return _empty_clv_analysis()
+
+        avg_clv = valid["clv"].mean()
+        pos_pct = (valid["clv"] > 0).mean() * 100
+
+        by_book = valid.groupby("sportsbook", observed=True).agg(
+            bets=("id", "count"),
+            avg_clv=("clv", "mean"),
+        ).reset_index().sort_values("avg_clv", ascending=False)
 
     return {
         "avg_clv": round(avg_clv, 2),
@@ -237,6 +422,70 @@ def clv_analysis(df: pd.DataFrame | None = None) -> dict[str, Any]:
     }
 
 
+def settled_breakdowns(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """
+    Every per-book / per-market breakdown of ``df`` from one groupby pass.
+
+    Totals are reduced once per (sportsbook, market_type) cell by the
+    :func:`~src.ev_kernels.group_totals` kernel, and the much smaller
+    result is rolled up from there.
+
+    Returns
+    -------
+    dict with keys: roi_by_sportsbook, roi_by_market (as returned by
+    :func:`roi_by_sportsbook` / :func:`roi_by_market`), clv_by_book (as in
+    :func:`clv_analysis`) and profit_heatmap (sportsbook × market_type
+    P&L grid, 0 where there are no bets).
+    """
+    if df.empty:
+        return {
+            "roi_by_sportsbook": pd.DataFrame(columns=["sportsbook", *_ROI_COLUMNS]),
+            "roi_by_market": pd.DataFrame(columns=["market_type", *_ROI_COLUMNS]),
+            "clv_by_book": pd.DataFrame(),
+            "profit_heatmap": pd.DataFrame(),
+        }
+
+    book_codes, books = pd.factorize(df["sportsbook"], sort=True)
+    market_codes, markets = pd.factorize(df["market_type"], sort=True)
+    n_markets = len(markets)
+    cell_codes = np.where(
+        (book_codes >= 0) & (market_codes >= 0), book_codes * n_markets + market_codes, -1
+    ).astype(np.int64)
+    values = df[["stake", "profit_loss", "clv"]].to_numpy(dtype=float)
+    rows, sums, counts = group_totals(cell_codes, values, len(books) * n_markets)
+
+    hit = np.flatnonzero(rows)
+    cells = pd.DataFrame(
+        {
+            "bets": rows[hit],
+            "staked": sums[hit, 0],
+            "profit": sums[hit, 1],
+            "clv_sum": sums[hit, 2],
+            "clv_bets": counts[hit, 2],
+        },
+        index=pd.MultiIndex.from_arrays(
+            [books[hit // n_markets], markets[hit % n_markets]],
+            names=["sportsbook", "market_type"],
+        ),
+    )
+    totals = ["bets", "staked", "profit"]
+    by_book = cells.groupby(level="sportsbook", observed=True).sum()
+    by_market = cells.groupby(level="market_type", observed=True).sum()
+
+    clv = by_book.loc[by_book["clv_bets"] > 0, ["clv_bets", "clv_sum"]]
+    clv_by_book = pd.DataFrame({
+        "bets": clv["clv_bets"],
+        "avg_clv": clv["clv_sum"] / clv["clv_bets"],
+    }).reset_index().sort_values("avg_clv", ascending=False)
+
+    return {
+        "roi_by_sportsbook": _with_roi(by_book[totals].reset_index()),
+        "roi_by_market": _with_roi(by_market[totals].reset_index()),
+        "clv_by_book": clv_by_book,
+        "profit_heatmap": cells["profit"].unstack(fill_value=0),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Line movement analysis
 # ---------------------------------------------------------------------------
@@ -249,14 +498,18 @@ def line_movement_for_game(
     Return a time-series of odds movements for a game.
 
     Columns: snapshot_time, sportsbook, market_type, selection, point,
-    odds_decimal, implied_prob.
+    player_name, odds_decimal, implied_prob.
     """
-    rows = get_odds_history(game_id, sportsbook=sportsbook)
-    if not rows:
+    columns = get_odds_history_columns(game_id, sportsbook=sportsbook)
+    if not columns["snapshot_time"]:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
-    df["snapshot_time"] = pd.to_datetime(df["snapshot_time"])
-    return df.sort_values("snapshot_time")
+    # The query already orders by snapshot_time, and psycopg2 returns
+    # datetimes, so there is nothing to sort and usually nothing to parse.
+    df = pd.DataFrame(columns)
+    if not pd.api.types.is_datetime64_any_dtype(df["snapshot_time"]):
+        # Mixed UTC offsets (e.g. across a DST change) stay object dtype
+        df["snapshot_time"] = pd.to_datetime(df["snapshot_time"], utc=True)
+    return df
 
 
 def detect_significant_movements(
@@ -278,16 +531,19 @@ def detect_significant_movements(
         Each dict: sportsbook, market_type, selection, opening_odds,
         current_odds, change_pct.
     """
-    df = line_movement_for_game(game_id)
-    if df.empty:
-        return []
+    # Only the first and last price per line matter — stream the history
+    # (already in snapshot order) instead of building a DataFrame of it.
+    first_last: dict[tuple[str, str, str], list[float]] = {}
+    for row in stream_odds_history(game_id):
+        key = (row["sportsbook"], row["market_type"], row["selection"])
+        prices = first_last.get(key)
+        if prices is None:
+            first_last[key] = [row["odds_decimal"], row["odds_decimal"]]
+        else:
+            prices[1] = row["odds_decimal"]
 
     alerts: list[dict[str, Any]] = []
-    grouped = df.groupby(["sportsbook", "market_type", "selection"])
-
-    for (book, mtype, sel), group in grouped:
-        opening = group.iloc[0]["odds_decimal"]
-        latest = group.iloc[-1]["odds_decimal"]
+    for (book, mtype, sel), (opening, latest) in sorted(first_last.items()):
         if opening == 0:
             continue
         change = ((latest - opening) / opening) * 100
@@ -309,18 +565,25 @@ def detect_significant_movements(
 # ---------------------------------------------------------------------------
 
 
-def bankroll_time_series() -> pd.DataFrame:
+# Plotly gains nothing from more points than a chart is wide
+_MAX_PLOT_POINTS = 5000
+
+
+def bankroll_time_series(max_points: int = _MAX_PLOT_POINTS) -> pd.DataFrame:
     """
     Load bankroll history as a DataFrame for plotting.
 
+    Longer histories are thinned in the database to about ``max_points``
+    evenly spaced snapshots (always keeping the latest).
+
     Columns: snapshot_time, bankroll, cumulative_profit, roi, win_rate,
     total_bets.
     """
-    rows = get_bankroll_history()
-    if not rows:
+    columns = get_bankroll_history_columns(max_points)
+    if not columns["snapshot_time"]:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
-    df["snapshot_time"] = pd.to_datetime(df["snapshot_time"])
+    df = pd.DataFrame(columns)
+    df["snapshot_time"] = pd.to_datetime(df["snapshot_time"], utc=True)
     return df
 
 
@@ -328,18 +591,30 @@ def cumulative_pnl_series(df: pd.DataFrame | None = None) -> pd.DataFrame:
     """
     Build a per-bet cumulative P&L series from settled bets.
 
-    Useful for plotting the equity curve.
+    Useful for plotting the equity curve.  Without ``df`` the running
+    total is computed by a window function in the database.
 
     Returns DataFrame with columns: placed_at, profit_loss, cumulative_pnl.
     """
     if df is None:
-        df = settled_bets_df()
+        series = pd.DataFrame(get_cumulative_pnl_columns())
+        if not series.empty:
+            series["placed_at"] = pd.to_datetime(series["placed_at"], utc=True)
+        return series
     if df.empty:
-        return pd.DataFrame(columns=["placed_at", "profit_loss", "cumulative_pnl"])
-
-    series = df[["placed_at", "profit_loss"]].sort_values("placed_at").copy()
-    series["cumulative_pnl"] = series["profit_loss"].cumsum()
-    return series
+        return pd.DataFrame(columns=_PNL_COLUMNS)
+
+    # Frames from settled_bets_df() are already in placement order
+    if not df["placed_at"].is_monotonic_increasing:
+        df = df.sort_values("placed_at", kind="stable")
+    pnl = df["profit_loss"].to_numpy(dtype=float)
+    cum = np.empty(len(pnl))
+    np.cumsum(pnl, out=cum)
+    return pd.DataFrame({
+        "placed_at": df["placed_at"].reset_index(drop=True),
+        "profit_loss": pnl,
+        "cumulative_pnl": cum,
+    })
 
 
 # ---------------------------------------------------------------------------
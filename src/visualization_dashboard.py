@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Ensure project root is on sys.path so `src.*` imports work when
@@ -27,12 +28,12 @@ if _PROJECT_ROOT not in sys.path:
 
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
 import numpy as np
 
 from src.config import MIN_EV_THRESHOLD, STARTING_BANKROLL, PREFERRED_REGION
+from src.ev_kernels import american_from_decimal
 
 
 def decimal_to_american(dec: float) -> str:
@@ -44,6 +45,17 @@ def decimal_to_american(dec: float) -> str:
     return f"{round(-100 / (dec - 1))}"
 
 
+def decimal_to_american_series(dec: pd.Series) -> pd.Series:
+    """Vectorised :func:`decimal_to_american` for a column of decimal odds."""
+    odds = pd.to_numeric(dec, errors="coerce").to_numpy(dtype=float)
+    american, valid = american_from_decimal(odds)
+    american = american[valid]
+    out = np.full(odds.shape, "", dtype=object)
+    out[valid] = np.char.add(np.where(american >= 0, "+", ""), american.astype(str))
+    return pd.Series(out, index=dec.index)
+
+
+@lru_cache(maxsize=1024)
 def format_commence_time(ts) -> str:
     """Format a timestamp to 'January 1, 2026, 7:30pm' style."""
     if pd.isna(ts):
@@ -52,6 +64,19 @@ def format_commence_time(ts) -> str:
     return t.strftime("%B %-d, %Y, %-I:%M%p").replace("AM", "am").replace("PM", "pm")
 
 
+def format_commence_time_series(col: pd.Series) -> pd.Series:
+    """
+    Vectorised :func:`format_commence_time` for a column of timestamps.
+
+    Each game's start time repeats across many rows, so only the distinct
+    values are formatted.
+    """
+    codes, uniques = pd.factorize(col)
+    # Trailing "" is what code -1 (missing) picks up
+    labels = np.array([format_commence_time(t) for t in uniques] + [""], dtype=object)
+    return pd.Series(labels[codes], index=col.index)
+
+
 def _prepare_ev_df(df: pd.DataFrame, keep_best_book_only: bool = False) -> pd.DataFrame:
     """
     Common prep for EV opportunity DataFrames: dedup, American odds, date format, benchmark.
@@ -70,18 +95,18 @@ def _prepare_ev_df(df: pd.DataFrame, keep_best_book_only: bool = False) -> pd.Da
     if keep_best_book_only:
         # Count how many books have positive EV for each market/selection/point combo
         group_cols = [c for c in ["game_id", "market_type", "player_name", "selection", "point"] if c in df.columns]
-        df["num_positive_ev_books"] = df.groupby(group_cols)["ev_percent"].transform("count")
-        # Keep only the best book (highest EV) for each combo
-        df = df.sort_values("ev_percent", ascending=False).drop_duplicates(
-            subset=group_cols, keep="first"
-        )
+        # (dropna=False: game markets have no player_name, props may have no point)
+        by_line = df.groupby(group_cols, sort=False, dropna=False)["ev_percent"]
+        df["num_positive_ev_books"] = by_line.transform("size")
+        # Keep only the best book (highest EV) for each combo, best first
+        df = df.loc[by_line.idxmax()].sort_values("ev_percent", ascending=False)
 
     # American odds
-    df["book_american"] = df["book_odds"].apply(decimal_to_american)
-    df["benchmark_american"] = df["pinnacle_odds"].apply(decimal_to_american)
+    df["book_american"] = decimal_to_american_series(df["book_odds"])
+    df["benchmark_american"] = decimal_to_american_series(df["pinnacle_odds"])
     # Friendly date format
     if "commence_time" in df.columns:
-        df["commence_time"] = df["commence_time"].apply(format_commence_time)
+        df["commence_time"] = format_commence_time_series(df["commence_time"])
     # Benchmark label — capitalise for display
     if "benchmark" in df.columns:
         df["benchmark"] = df["benchmark"].str.capitalize()
@@ -92,27 +117,215 @@ def _prepare_ev_df(df: pd.DataFrame, keep_best_book_only: bool = False) -> pd.Da
 
 from src.database import (
     get_all_latest_odds_for_game,
-    get_ev_opportunities_by_date,
+    get_ev_opportunities_by_date_columns,
     get_last_scan_time,
     get_live_ev_opportunities,
     get_upcoming_games,
-    init_schema,
 )
-from src.ev_calculation import scan_all_upcoming
 from src.strategy_analysis import (
     bankroll_time_series,
     clv_analysis,
     compute_cumulative_stats,
     cumulative_pnl_series,
-    ev_vs_actual_correlation,
+    ev_profit_correlation,
     line_movement_for_game,
-    roi_by_market,
-    roi_by_sportsbook,
     settled_bets_df,
+    settled_bets_key,
+    settled_breakdowns,
 )
 
 logger = logging.getLogger(__name__)
 
+
+# ---------------------------------------------------------------------------
+# Cached reads
+# ---------------------------------------------------------------------------
+
+# Every widget interaction reruns this script; these sources only change when
+# the scheduler (or the Refresh button) scans, so reruns reuse the last read.
+_DASHBOARD_CACHE_TTL = 30
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_live_opportunities() -> list[dict]:
+    return get_live_ev_opportunities()
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_last_scan_time():
+    return get_last_scan_time()
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_opportunities_by_date(start, end, min_ev: float) -> pd.DataFrame:
+    return pd.DataFrame(get_ev_opportunities_by_date_columns(start, end, min_ev))
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_upcoming_games() -> list[dict]:
+    return get_upcoming_games()
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_line_movement(game_id: str) -> pd.DataFrame:
+    return line_movement_for_game(game_id)
+
+
+@st.cache_data(ttl=_DASHBOARD_CACHE_TTL, show_spinner=False)
+def _cached_bankroll_series() -> pd.DataFrame:
+    return bankroll_time_series()
+
+
+# Analytics over the settled-bets frame.  ``df_key`` (settled_bets_key) is the
+# cache key; the leading underscore stops Streamlit hashing the frame itself.
+# A new settled bet changes the key, so the TTL only bounds memory.
+_ANALYTICS_CACHE_TTL = 300
+
+# Bar charts with more bars than this drop their per-bar bet-count labels
+_MAX_LABELLED_BARS = 20
+
+# Every settled-bets column the Performance Analytics page reads
+_ANALYTICS_COLUMNS = [
+    "id", "sportsbook", "market_type", "stake", "profit_loss",
+    "ev_at_placement", "clv", "outcome",
+]
+
+
+@st.cache_data(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _cached_breakdowns(df_key: tuple, _df: pd.DataFrame) -> dict:
+    return settled_breakdowns(_df)
+
+
+@st.cache_data(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _cached_ev_correlation(df_key: tuple, _df: pd.DataFrame) -> float:
+    # The page shows only the coefficient, so skip the EV buckets
+    return ev_profit_correlation(
+        _df["ev_at_placement"].to_numpy(dtype=float),
+        _df["profit_loss"].to_numpy(dtype=float),
+    )
+
+
+@st.cache_data(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _cached_clv_analysis(df_key: tuple, _df: pd.DataFrame) -> dict:
+    return clv_analysis(_df)
+
+
+# Figures for the same tabs.  cache_resource hands back the same Figure, so
+# reruns skip rebuilding it; they are never modified after construction.
+# A builder with nothing to plot caches None, so the empty check also runs
+# once per df_key.
+
+
+def _plot(fig) -> None:
+    if fig is not None:
+        st.plotly_chart(fig, use_container_width=True)
+
+
+@st.cache_resource(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _roi_figure(df_key: tuple, column: str, _roi: pd.DataFrame):
+    if _roi.empty:
+        return None
+    fig = px.bar(
+        _roi, x=column, y="roi",
+        color="roi",
+        color_continuous_scale=["red", "grey", "green"],
+        labels={"roi": "ROI %"},
+        text="bets" if len(_roi) <= _MAX_LABELLED_BARS else None,
+    )
+    return fig
+
+
+@st.cache_resource(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _ev_scatter_figure(df_key: tuple, _df: pd.DataFrame):
+    """EV-vs-profit scatter with a least-squares fit line, or None without data."""
+    import plotly.graph_objects as go
+
+    # Copy only the plotted columns of the usable rows
+    mask = _df["ev_at_placement"].notna() & _df["profit_loss"].notna()
+    valid = _df.loc[mask, ["ev_at_placement", "profit_loss", "outcome"]]
+    if valid.empty:
+        return None
+    # One point per settled bet: WebGL keeps thousands of markers out of the SVG DOM
+    fig = px.scatter(
+        valid, x="ev_at_placement", y="profit_loss",
+        color="outcome",
+        render_mode="webgl",
+        labels={
+            "ev_at_placement": "EV at Placement (%)",
+            "profit_loss": "Profit / Loss ($)",
+        },
+    )
+    x = valid["ev_at_placement"].to_numpy(dtype=float)
+    y = valid["profit_loss"].to_numpy(dtype=float)
+    if np.ptp(x) > 0:
+        slope, intercept = np.polyfit(x, y, 1)
+        ends = np.array([x.min(), x.max()])
+        fig.add_trace(go.Scatter(
+            x=ends, y=slope * ends + intercept,
+            mode="lines", name="OLS fit", line=dict(color="grey", dash="dash"),
+        ))
+    return fig
+
+
+@st.cache_resource(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _clv_by_book_figure(df_key: tuple, _clv_book: pd.DataFrame):
+    if _clv_book.empty:
+        return None
+    fig = px.bar(
+        _clv_book, x="sportsbook", y="avg_clv",
+        text="bets" if len(_clv_book) <= _MAX_LABELLED_BARS else None,
+        labels={"avg_clv": "Avg CLV %"},
+        title="Average CLV by Sportsbook",
+    )
+    return fig
+
+
+@st.cache_resource(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _clv_histogram_figure(df_key: tuple, _df: pd.DataFrame):
+    """
+    CLV distribution histogram, or None without CLV data.
+
+    Binned here so the browser gets 30 bars rather than every bet's CLV.
+    """
+    import plotly.graph_objects as go
+
+    clv = _df["clv"].to_numpy(dtype=float)
+    clv = clv[~np.isnan(clv)]
+    if clv.size == 0:
+        return None
+    counts, edges = np.histogram(clv, bins=30)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges)))
+    fig.update_layout(
+        title="CLV Distribution",
+        xaxis_title="CLV %",
+        yaxis_title="count",
+        bargap=0,
+    )
+    return fig
+
+
+@st.cache_resource(ttl=_ANALYTICS_CACHE_TTL, show_spinner=False)
+def _profit_heatmap_figure(df_key: tuple, _heat: pd.DataFrame):
+    if _heat.empty:
+        return None
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=_heat.values,
+            x=_heat.columns.tolist(),
+            y=_heat.index.tolist(),
+            colorscale="RdYlGn",
+            texttemplate="%{z:.2f}",
+        )
+    )
+    fig.update_layout(
+        title="P&L by Sportsbook × Market",
+        xaxis_title="Market",
+        yaxis_title="Sportsbook",
+    )
+    return fig
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -151,6 +364,20 @@ st.sidebar.markdown(
 # Display columns shared across Live and Historical pages
 # ---------------------------------------------------------------------------
 
+def _market_keys(df: pd.DataFrame) -> list[tuple]:
+    """
+    (game_id, market_type, player_name, selection, point) for each row.
+
+    Missing player names become "" and missing points None, so keys for the
+    same market compare (and hash) equal — NaN never does.
+    """
+    points = df["point"].astype(object).where(df["point"].notna(), None)
+    return list(zip(
+        df["game_id"], df["market_type"], df["player_name"].fillna(""),
+        df["selection"], points,
+    ))
+
+
 _DISPLAY_COLS = [
     "home_team", "away_team", "commence_time",
     "market_type", "player_name", "selection", "point", "pinnacle_point",
@@ -168,20 +395,24 @@ if page == "Live EV Opportunities":
 
     col1, col2 = st.columns([3, 1])
     with col1:
-        last_scan = get_last_scan_time()
+        last_scan = _cached_last_scan_time()
         if last_scan:
             st.caption(f"Last refreshed: {format_commence_time(last_scan)}")
         else:
             st.caption("No scans recorded yet.")
     with col2:
         if st.button("Refresh (scan now)"):
+            # Imported on demand: the scanner stack is only needed for a manual scan
+            from src.ev_calculation import scan_all_upcoming
+
             with st.spinner("Scanning upcoming games…"):
                 new_opps = scan_all_upcoming()
+            st.cache_data.clear()
             st.success(f"Found {len(new_opps)} opportunities.")
             st.rerun()
 
     # Load live opportunities (most recent scan only)
-    opps = get_live_ev_opportunities()
+    opps = _cached_live_opportunities()
 
     if opps:
         df = pd.DataFrame(opps)
@@ -204,17 +435,21 @@ if page == "Live EV Opportunities":
         st.markdown("---")
         st.subheader("View All Books for a Market")
 
-        # Build unique market combinations
-        market_options = []
+        # Build unique market combinations, walking columns rather than iterrows()
         market_map = {}
-        for _, row in df.iterrows():
-            game_label = f"{row.get('away_team', '?')} @ {row.get('home_team', '?')} ({row.get('commence_time', '')})"
-            market_key = (row["game_id"], row["market_type"], row.get("player_name", ""),
-                         row["selection"], row.get("point"))
-            point_str = f" ({row['point']})" if pd.notna(row["point"]) else ""
-            market_label = f"{game_label} — {row['market_type']} {row.get('player_name', '')} {row['selection']}{point_str}".replace("  ", " ")
-            market_options.append(market_label)
-            market_map[market_label] = market_key
+        for key, away, home, start in zip(
+            _market_keys(df), df["away_team"], df["home_team"], df["commence_time"],
+        ):
+            _, mtype, player, sel, point = key
+            point_str = f" ({point})" if point is not None else ""
+            market_label = f"{away} @ {home} ({start}) — {mtype} {player} {sel}{point_str}".replace("  ", " ")
+            market_map[market_label] = key
+        market_options = list(market_map)
+
+        # Raw row positions per market, so picking one is a dict lookup
+        rows_by_market: dict[tuple, list[int]] = {}
+        for pos, key in enumerate(_market_keys(df_raw)):
+            rows_by_market.setdefault(key, []).append(pos)
 
         if market_options:
             selected_market_label = st.selectbox(
@@ -222,20 +457,7 @@ if page == "Live EV Opportunities":
                 market_options,
                 key="market_selector"
             )
-            game_id, market_type, player_name, selection, point = market_map[selected_market_label]
-
-            # Filter raw data for this market
-            books_df = df_raw[
-                (df_raw["game_id"] == game_id) &
-                (df_raw["market_type"] == market_type) &
-                ((df_raw["player_name"] == player_name) | (df_raw["player_name"].isna() & (player_name == ""))) &
-                (df_raw["selection"] == selection)
-            ].copy()
-            # Also filter by point (handle NaN values)
-            if pd.notna(point):
-                books_df = books_df[books_df["point"] == point]
-            else:
-                books_df = books_df[books_df["point"].isna()]
+            books_df = df_raw.iloc[rows_by_market.get(market_map[selected_market_label], [])]
 
             if not books_df.empty:
                 books_df = _prepare_ev_df(books_df, keep_best_book_only=False)
@@ -254,10 +476,14 @@ if page == "Live EV Opportunities":
         st.markdown("---")
         st.subheader("Game Detail — All Available Markets")
 
-        game_labels = {}
-        for _, row in df_raw.drop_duplicates(subset=["game_id"]).iterrows():
-            label = f"{row.get('away_team', '?')} @ {row.get('home_team', '?')} ({row.get('commence_time', '')})"
-            game_labels[label] = row["game_id"]
+        games_df = df_raw.drop_duplicates(subset=["game_id"])
+        game_labels = {
+            f"{away} @ {home} ({start})": gid
+            for gid, away, home, start in zip(
+                games_df["game_id"], games_df["away_team"],
+                games_df["home_team"], games_df["commence_time"],
+            )
+        }
 
         if game_labels:
             selected_label = st.selectbox("Select a game to view all markets", list(game_labels.keys()))
@@ -266,7 +492,7 @@ if page == "Live EV Opportunities":
             all_odds = get_all_latest_odds_for_game(selected_game_id)
             if all_odds:
                 odds_df = pd.DataFrame(all_odds)
-                odds_df["american"] = odds_df["odds_decimal"].apply(decimal_to_american)
+                odds_df["american"] = decimal_to_american_series(odds_df["odds_decimal"])
                 market_filter = st.multiselect(
                     "Filter by market",
                     odds_df["market_type"].unique().tolist(),
@@ -315,10 +541,9 @@ elif page == "Historical Opportunities":
     start_dt = dt.combine(start_date, dtime.min)
     end_dt = dt.combine(end_date, dtime.max)
 
-    opps = get_ev_opportunities_by_date(start_dt, end_dt, min_ev)
+    df = _cached_opportunities_by_date(start_dt, end_dt, min_ev)
 
-    if opps:
-        df = pd.DataFrame(opps)
+    if not df.empty:
         df = _prepare_ev_df(df)
 
         st.metric("Total Opportunities", len(df))
@@ -342,7 +567,7 @@ elif page == "Historical Opportunities":
 
         # Breakdown by sportsbook
         st.subheader("Opportunities by Sportsbook")
-        book_counts = df.groupby("sportsbook").size().reset_index(name="count")
+        book_counts = df["sportsbook"].value_counts().rename_axis("sportsbook").reset_index(name="count")
         fig2 = px.bar(book_counts, x="sportsbook", y="count", labels={"count": "Opportunities"})
         st.plotly_chart(fig2, use_container_width=True)
     else:
@@ -356,7 +581,7 @@ elif page == "Historical Opportunities":
 elif page == "Line Movement":
     st.title("Line Movement Tracker")
 
-    games = get_upcoming_games()
+    games = _cached_upcoming_games()
     if not games:
         st.info("No upcoming games loaded yet.")
     else:
@@ -367,17 +592,15 @@ elif page == "Line Movement":
         selected_label = st.selectbox("Select a game", list(game_options.keys()))
         selected_game_id = game_options[selected_label]
 
-        df = line_movement_for_game(selected_game_id)
+        df = _cached_line_movement(selected_game_id)
         if df.empty:
             st.warning("No odds history for this game yet.")
         else:
             # Filter by market
-            market_filter = st.multiselect(
-                "Market type",
-                df["market_type"].unique().tolist(),
-                default=df["market_type"].unique().tolist(),
-            )
-            filtered = df[df["market_type"].isin(market_filter)]
+            markets = df["market_type"].unique().tolist()
+            market_filter = st.multiselect("Market type", markets, default=markets)
+            # Only copy the history when some markets are deselected
+            filtered = df if len(market_filter) == len(markets) else df[df["market_type"].isin(market_filter)]
 
             fig = px.line(
                 filtered,
@@ -404,6 +627,7 @@ elif page == "Line Movement":
 elif page == "Bankroll & P/L":
     st.title("Bankroll & Profit / Loss")
 
+    # Both computed in the database — this page never loads every bet
     stats = compute_cumulative_stats()
 
     # KPI row
@@ -431,7 +655,7 @@ elif page == "Bankroll & P/L":
 
     # Bankroll history
     st.subheader("Bankroll History")
-    bh = bankroll_time_series()
+    bh = _cached_bankroll_series()
     if not bh.empty:
         fig2 = px.line(
             bh, x="snapshot_time", y="bankroll",
@@ -449,7 +673,8 @@ elif page == "Bankroll & P/L":
 elif page == "Performance Analytics":
     st.title("Performance Analytics")
 
-    df = settled_bets_df()
+    df = settled_bets_df(_ANALYTICS_COLUMNS)
+    df_key = settled_bets_key(df)
     if df.empty:
         st.info("No settled bets to analyse. Start placing bets to generate analytics.")
     else:
@@ -457,101 +682,37 @@ elif page == "Performance Analytics":
             "ROI Breakdown", "EV vs Actual", "CLV Analysis", "Heatmap"
         ])
 
+        # ROI, CLV-by-book and heatmap tables all come from one groupby pass
+        breakdowns = _cached_breakdowns(df_key, df)
+
         # --- Tab 1: ROI Breakdown ---
         with tab1:
             st.subheader("ROI by Sportsbook")
-            roi_book = roi_by_sportsbook(df)
-            if not roi_book.empty:
-                fig = px.bar(
-                    roi_book, x="sportsbook", y="roi",
-                    color="roi",
-                    color_continuous_scale=["red", "grey", "green"],
-                    labels={"roi": "ROI %"},
-                    text="bets",
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            _plot(_roi_figure(df_key, "sportsbook", breakdowns["roi_by_sportsbook"]))
 
             st.subheader("ROI by Market Type")
-            roi_mkt = roi_by_market(df)
-            if not roi_mkt.empty:
-                fig2 = px.bar(
-                    roi_mkt, x="market_type", y="roi",
-                    color="roi",
-                    color_continuous_scale=["red", "grey", "green"],
-                    labels={"roi": "ROI %"},
-                    text="bets",
-                )
-                st.plotly_chart(fig2, use_container_width=True)
+            _plot(_roi_figure(df_key, "market_type", breakdowns["roi_by_market"]))
 
         # --- Tab 2: EV vs Actual ---
         with tab2:
             st.subheader("EV at Placement vs Actual Profit")
-            ev_data = ev_vs_actual_correlation(df)
-            st.metric("Correlation (EV → Profit)", ev_data["correlation"])
-
-            valid = df.dropna(subset=["ev_at_placement", "profit_loss"])
-            if not valid.empty:
-                fig = px.scatter(
-                    valid, x="ev_at_placement", y="profit_loss",
-                    color="outcome",
-                    labels={
-                        "ev_at_placement": "EV at Placement (%)",
-                        "profit_loss": "Profit / Loss ($)",
-                    },
-                    trendline="ols",
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            st.metric("Correlation (EV → Profit)", _cached_ev_correlation(df_key, df))
+
+            _plot(_ev_scatter_figure(df_key, df))
 
         # --- Tab 3: CLV Analysis ---
         with tab3:
             st.subheader("Closing Line Value")
-            clv_data = clv_analysis(df)
+            clv_data = _cached_clv_analysis(df_key, df)
             c1, c2 = st.columns(2)
             c1.metric("Avg CLV", f"{clv_data['avg_clv']:.2f}%")
             c2.metric("Bets Beating Close", f"{clv_data['positive_clv_pct']:.1f}%")
 
-            clv_book = clv_data["clv_by_book"]
-            if not clv_book.empty:
-                fig = px.bar(
-                    clv_book, x="sportsbook", y="avg_clv",
-                    text="bets",
-                    labels={"avg_clv": "Avg CLV %"},
-                    title="Average CLV by Sportsbook",
-                )
-                st.plotly_chart(fig, use_container_width=True)
-
-            clv_col = df.dropna(subset=["clv"])
-            if not clv_col.empty:
-                fig2 = px.histogram(
-                    clv_col, x="clv", nbins=30,
-                    labels={"clv": "CLV %"},
-                    title="CLV Distribution",
-                )
-                st.plotly_chart(fig2, use_container_width=True)
+            _plot(_clv_by_book_figure(df_key, breakdowns["clv_by_book"]))
+
+            _plot(_clv_histogram_figure(df_key, df))
 
         # --- Tab 4: Heatmap ---
         with tab4:
             st.subheader("Profit Heatmap — Sportsbook × Market")
-            pivot = df.groupby(
-                ["sportsbook", "market_type"]
-            )["profit_loss"].sum().reset_index()
-            if not pivot.empty:
-                heat = pivot.pivot(
-                    index="sportsbook", columns="market_type", values="profit_loss"
-                ).fillna(0)
-                fig = go.Figure(
-                    data=go.Heatmap(
-                        z=heat.values,
-                        x=heat.columns.tolist(),
-                        y=heat.index.tolist(),
-                        colorscale="RdYlGn",
-                        text=heat.values.round(2),
-                        texttemplate="%{text}",
-                    )
-                )
-                fig.update_layout(
-                    title="P&L by Sportsbook × Market",
-                    xaxis_title="Market",
-                    yaxis_title="Sportsbook",
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            _plot(_profit_heatmap_figure(df_key, breakdowns["profit_heatmap"]))
@@ -0,0 +1,21 @@
+import pytest
+
+from src import strategy_analysis
+
+
+@pytest.fixture
+def no_settled_bets(monkeypatch):
+    monkeypatch.setattr(strategy_analysis, "get_settled_bets_version", lambda: (None, 0))
+    monkeypatch.setattr(strategy_analysis, "_read_settled_cache", lambda version: None)
+    monkeypatch.setattr(strategy_analysis, "get_all_settled_bets", lambda: [])
+    strategy_analysis._load_settled_bets_df.cache_clear()
+    yield
+    strategy_analysis._load_settled_bets_df.cache_clear()
+
+
+def test_settled_bets_df_columns_with_no_settled_bets(no_settled_bets):
+    columns = ["id", "sportsbook", "profit_loss"]
+    df = strategy_analysis.settled_bets_df(columns)
+    assert df.empty
+    assert list(df.columns) == columns
+    assert strategy_analysis.settled_bets_key(df) == (None, 0)